@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188`
+====================================================
+
+Optional features are imported on first access, so that importing the core
+driver (`adafruit_cap1188.i2c` or `adafruit_cap1188.spi`) stays small::
+
+    from adafruit_cap1188 import CAP1188Config  # loads adafruit_cap1188.config
+
+"""
+
+# public name -> submodule that defines it, imported on first access
+_LAZY = {
+    "CAP1188Array": "i2c_array",
+    "CAP1188Config": "config",
+    "CAP1188_AutoTuner": "tuning",
+    "CAP1188_Batch": "batch",
+    "CAP1188_Calibration": "calibration",
+    "CAP1188_Events": "events",
+    "CAP1188_Gestures": "gestures",
+    "CAP1188_HealthMonitor": "health",
+    "CAP1188_Instrumentation": "instrument",
+    "CAP1188_LogReader": "recorder",
+    "CAP1188_Publisher": "service",
+    "CAP1188_Recorder": "recorder",
+    "CAP1188_RetryPolicy": "retry",
+    "CAP1188_Slider": "slider",
+    "CAP1188_Subscriber": "service",
+    "SharedCAP1188": "threaded",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module 'adafruit_cap1188' has no attribute '{name}'")
+    module = __import__("adafruit_cap1188." + _LAZY[name], None, None, (name,))
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.asyncio`
+====================================================
+
+asyncio wrapper for the CAP1188 8-Key Capacitive Touch Sensor Breakout.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+* Adafruit's asyncio library:
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+"""
+
+import asyncio
+
+from adafruit_cap1188.events import CAP1188_Events
+
+try:
+    from typing import Optional, Tuple
+
+    from digitalio import DigitalInOut
+
+    from adafruit_cap1188.cap1188 import CAP1188, CAP1188_Snapshot
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+
+class AsyncCAP1188:
+    """Awaitable access to a CAP1188. Bus access is serialized through an
+    `asyncio.Lock`, which can be shared by several sensors on the same bus.
+
+    :param CAP1188 cap1188: The sensor to wrap.
+    :param asyncio.Lock lock: Optional lock shared with other devices on the bus.
+    :param DigitalInOut alert: Optional input connected to the ALERT pin.
+    :param int size: Maximum number of buffered touch events.
+    """
+
+    def __init__(
+        self,
+        cap1188: "CAP1188",
+        lock: Optional[asyncio.Lock] = None,
+        alert: Optional["DigitalInOut"] = None,
+        size: int = 16,
+    ) -> None:
+        self._cap1188 = cap1188
+        self._lock = asyncio.Lock() if lock is None else lock
+        self._events = CAP1188_Events(cap1188, alert, size)
+        self._period = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """The lock guarding bus access."""
+        return self._lock
+
+    async def refresh_period(self) -> float:
+        """Read the sensor cycle time and use it, in seconds, as the polling
+        period. Call again after changing `CAP1188_Settings.cycle`."""
+        async with self._lock:
+            self._period = self._cap1188.cycle_seconds
+        return self._period
+
+    async def snapshot(self) -> "CAP1188_Snapshot":
+        """Awaitable `CAP1188.snapshot`."""
+        async with self._lock:
+            return self._cap1188.snapshot()
+
+    async def touched(self) -> int:
+        """Awaitable `CAP1188.touched`."""
+        async with self._lock:
+            return self._cap1188.touched()
+
+    def events(self) -> "_AsyncEvents":
+        """Return an asynchronous iterator of ``(pin, pressed)`` touch events,
+        polling once per sensor cycle::
+
+            async for pin, pressed in cap.events():
+                print(pin, pressed)
+        """
+        return _AsyncEvents(self)
+
+
+class _AsyncEvents:
+    def __init__(self, owner: AsyncCAP1188) -> None:
+        self._owner = owner
+
+    def __aiter__(self) -> "_AsyncEvents":
+        return self
+
+    async def __anext__(self) -> Tuple[int, bool]:
+        owner = self._owner
+        events = owner._events
+        while True:
+            event = events.get()
+            if event is not None:
+                return event
+            if owner._period is None:
+                await owner.refresh_period()
+            async with owner._lock:
+                events.update()
+            if not len(events):
+                await asyncio.sleep(owner._period)
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.batch`
+====================================================
+
+Coalesced configuration register access for compound CAP1188 settings,
+returned by `CAP1188_Settings.batch`.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+While a batch is open, configuration registers read by the driver's
+properties are read from the device once and then served from the batch,
+and writes only update the batch. Several fields of one register, such as
+`CAP1188_Settings.averaging`, `CAP1188_Settings.sample` and
+`CAP1188_Settings.cycle` in 0x24, are thereby merged into one value. On
+exit the changed registers are written with as few bus writes as possible,
+bridging short gaps of registers whose value is already known.
+
+"""
+
+try:
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+
+class CAP1188_Batch:
+    """Queue of configuration register reads and writes of one driver.
+
+    :param CAP1188 cap1188: The driver to batch.
+    """
+
+    def __init__(self, cap1188: "CAP1188") -> None:
+        self._cap1188 = cap1188
+        self._depth = 0
+        self.values = bytearray(256)
+        """Register values known to the batch."""
+        # 0: unknown, 1: read from the device, 2: written in the batch
+        self.state = bytearray(256)
+
+    def __enter__(self) -> "CAP1188_Batch":
+        if not self._depth:
+            self._clear()
+            self._cap1188._batch = self
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        self._cap1188._batch = None
+        if exc_type is None:
+            self.flush()
+
+    def write(self, address: int, value: int) -> None:
+        """Queue a register write; writing back a value read in the batch is
+        dropped."""
+        if self.state[address] == 1 and self.values[address] == value:
+            return
+        self.values[address] = value
+        self.state[address] = 2
+
+    def read_block_into(self, start: int, buf: bytearray) -> bool:
+        """Fill buf from start address and return `True` if the batch knows
+        all of its registers."""
+        state = self.state
+        for address in range(start, start + len(buf)):
+            if not state[address]:
+                return False
+        for i in range(len(buf)):
+            buf[i] = self.values[start + i]
+        return True
+
+    def merge(self, start: int, buf: bytearray) -> None:
+        """Record values read from start address, replacing those with queued
+        writes in buf."""
+        for i in range(len(buf)):
+            address = start + i
+            if self.state[address] == 2:
+                buf[i] = self.values[address]
+            else:
+                self.values[address] = buf[i]
+                self.state[address] = 1
+
+    def flush(self) -> int:
+        """Write the queued registers now and return the number of bus
+        writes. Called when the outermost block exits."""
+        cap = self._cap1188
+        batch = cap._batch
+        cap._batch = None
+        writes = cap._write_config_changes(0, self.values, self.state)
+        cap._batch = batch
+        return writes
+
+    def _clear(self) -> None:
+        for address in range(256):
+            self.state[address] = 0
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.calibration`
+====================================================
+
+Non-blocking CAP1188 calibration with completion polling.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The bits of the Calibration Activate register (0x26) clear when the
+calibration of their pin is done. `CAP1188_Calibration` collects requests
+for several pins, starts them with a single register write and polls the
+register until all bits are clear, so callers neither sleep a guessed time
+nor read deltas of a half calibrated pin::
+
+    calibration = CAP1188_Calibration(cap)
+    calibration.request(0x03)
+    calibration.request(0x06)  # merged into one write of 0x07
+    while calibration.poll():
+        do_other_work()
+    print(calibration.duration, "ms")
+
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from typing import Optional
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_CAL_ACTIVATE = const(0x26)
+
+
+class CAP1188_Calibration:
+    """Calibration job for the pins of a CAP1188.
+
+    :param CAP1188 cap1188: The sensor to calibrate.
+    """
+
+    def __init__(self, cap1188: "CAP1188") -> None:
+        self._cap1188 = cap1188
+        self._requested = 0
+        self._running = 0
+        self._start = None
+        self.duration = None
+        """Time in milliseconds the last completed calibration took, from the
+        register write to the poll that found it done."""
+        self.max_duration = 0
+        """Longest completed calibration in milliseconds."""
+
+    @property
+    def pending(self) -> int:
+        """8 bit mask of pins requested or still calibrating."""
+        return self._requested | self._running
+
+    @property
+    def done(self) -> bool:
+        """Whether no calibration is requested or running."""
+        return not (self._requested | self._running)
+
+    def request(self, mask: int = 0xFF) -> None:
+        """Add the pins in mask to the next calibration. Requests made before
+        the next `poll` are started together."""
+        self._requested |= mask & 0xFF
+
+    def poll(self) -> int:
+        """Start requested calibrations and read which are still running.
+        Returns the mask of pins not done yet, 0 when the job is complete."""
+        cap = self._cap1188
+        if self._running:
+            self._running = cap._read_register(_CAP1188_CAL_ACTIVATE)
+            if not self._running:
+                now = time.monotonic_ns() // 1000000
+                self.duration = now - self._start
+                self.max_duration = max(self.max_duration, self.duration)
+        if self._requested:
+            mask = self._requested | self._running
+            cap._write_register(_CAP1188_CAL_ACTIVATE, mask)
+            if not self._running:
+                self._start = time.monotonic_ns() // 1000000
+            self._running = mask
+            self._requested = 0
+        return self._running
+
+    def wait(self, timeout: Optional[float] = None, interval: float = 0.005) -> bool:
+        """Poll every interval seconds until the job is complete. Returns
+        `False` if timeout seconds passed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+        return True
+
+    async def wait_async(self, timeout: Optional[float] = None, interval: float = 0.005) -> bool:
+        """Awaitable `wait` that yields to other tasks between polls."""
+        import asyncio  # noqa: PLC0415
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+        return True
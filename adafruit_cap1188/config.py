@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.config`
+====================================================
+
+Snapshot, serialize, compare and bulk apply a CAP1188 configuration.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+A configuration holds the registers covered by the driver's shadow cache:
+0x1F-0x24, 0x27-0x2F, 0x30-0x37, 0x40-0x43 and 0x72. Reading it takes one
+block read per contiguous run; applying it against a known previous
+configuration only writes the registers that differ::
+
+    old = CAP1188Config.read(cap)
+    new = CAP1188Config.from_json(profile)
+    new.apply(cap, previous=old)
+
+"""
+
+import json
+
+from micropython import const
+
+from adafruit_cap1188.settings import _CONFIG_RUNS
+
+try:
+    from typing import List, Optional, Union
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CONFIG_SIZE = const(28)
+
+
+def _offset(address: int) -> int:
+    offset = 0
+    for start, length in _CONFIG_RUNS:
+        if start <= address < start + length:
+            return offset + address - start
+        offset += length
+    raise IndexError(f"Register 0x{address:02x} is not part of the configuration.")
+
+
+class CAP1188Config:
+    """The configuration registers of a CAP1188 as a compact 28 byte value.
+
+    :param bytes data: Register values in address order, as returned by
+        `to_bytes`. All zero if not given.
+    """
+
+    __slots__ = ("_data",)
+    # mutable, so not hashable
+    __hash__ = None
+
+    def __init__(self, data: Optional[Union[bytes, bytearray]] = None) -> None:
+        if data is None:
+            self._data = bytearray(_CONFIG_SIZE)
+        elif len(data) != _CONFIG_SIZE:
+            raise ValueError(f"Configuration data must be {_CONFIG_SIZE} bytes.")
+        else:
+            self._data = bytearray(data)
+
+    @classmethod
+    def read(cls, cap1188: "CAP1188") -> "CAP1188Config":
+        """Read the configuration of a device, one block read per register run."""
+        config = cls()
+        view = memoryview(config._data)
+        offset = 0
+        for start, length in _CONFIG_RUNS:
+            cap1188._read_config_block_into(start, view[offset : offset + length])
+            offset += length
+        return config
+
+    @classmethod
+    def from_json(cls, text: str) -> "CAP1188Config":
+        """Parse a configuration written by `to_json`. Registers missing from
+        the JSON object are left at zero."""
+        config = cls()
+        for address, value in json.loads(text).items():
+            config[int(address, 16)] = value
+        return config
+
+    def to_json(self) -> str:
+        """Return the configuration as a JSON object of hex register addresses
+        to values."""
+        values = {}
+        for start, length in _CONFIG_RUNS:
+            for address in range(start, start + length):
+                values[f"0x{address:02x}"] = self[address]
+        return json.dumps(values)
+
+    def to_bytes(self) -> bytes:
+        """Return the register values in address order."""
+        return bytes(self._data)
+
+    def __getitem__(self, address: int) -> int:
+        return self._data[_offset(address)]
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self._data[_offset(address)] = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CAP1188Config) and self._data == other._data
+
+    def diff(self, other: "CAP1188Config") -> List[int]:
+        """Return the addresses of the registers that differ from other."""
+        changed = []
+        offset = 0
+        for start, length in _CONFIG_RUNS:
+            for i in range(length):
+                if self._data[offset + i] != other._data[offset + i]:
+                    changed.append(start + i)
+            offset += length
+        return changed
+
+    def apply(self, cap1188: "CAP1188", previous: Optional["CAP1188Config"] = None) -> int:
+        """Write the configuration to a device. If previous, the configuration
+        the device currently holds, is given only the registers that differ
+        are written, merged into as few block writes as possible. Returns the
+        number of writes."""
+        data = self._data
+        view = memoryview(data)
+        writes = 0
+        offset = 0
+        for start, length in _CONFIG_RUNS:
+            # 2: to be written, 1: the device holds this value already
+            marks = bytearray(length)
+            for i in range(length):
+                if previous is None or data[offset + i] != previous._data[offset + i]:
+                    marks[i] = 2
+                else:
+                    marks[i] = 1
+            writes += cap1188._write_config_changes(start, view[offset : offset + length], marks)
+            offset += length
+        return writes
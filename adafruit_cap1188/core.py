@@ -0,0 +1,398 @@
+# SPDX-FileCopyrightText: 2018 Carter Nelson for Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.core`
+====================================================
+
+Core of the CircuitPython driver for the CAP1188 8-Key Capacitive Touch
+Sensor Breakout: register I/O, touch and snapshot reads. The full driver,
+`adafruit_cap1188.cap1188.CAP1188`, adds the configuration API.
+
+* Author(s): Carter Nelson, Jeremiah Rose, Jose David M.
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `CAP1188 - 8-Key Capacitive Touch Sensor Breakout
+  <https://www.adafruit.com/product/1602>`_  (Product ID: 1602)
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+* Adafruit's Bus Device library:
+  https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from typing import Callable, List, Optional, Tuple, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+
+_CAP1188_MID = const(0x5D)
+_CAP1188_PID = const(0x50)
+_CAP1188_MAIN_CONTROL = const(0x00)
+_CAP1188_GENERAL_STATUS = const(0x02)
+_CAP1188_INPUT_STATUS = const(0x03)
+_CAP1188_LED_STATUS = const(0x04)
+_CAP1188_NOISE_FLAGS = const(0x0A)
+_CAP1188_SNAPSHOT_LEN = const(0x18)
+_CAP1188_DELTA_COUNT = (
+    const(0x10),
+    const(0x11),
+    const(0x12),
+    const(0x13),
+    const(0x14),
+    const(0x15),
+    const(0x16),
+    const(0x17),
+)
+_CAP1188_CAL_ACTIVATE = const(0x26)
+_CAP1188_MULTI_TOUCH_CFG = const(0x2A)
+_CAP1188_THESHOLD_1 = const(0x30)
+_CAP1188_STANDBY_CFG = const(0x41)
+_CAP1188_LED_LINKING = const(0x72)
+_CAP1188_PRODUCT_ID = const(0xFD)
+_CAP1188_MANU_ID = const(0xFE)
+_CAP1188_REVISION = const(0xFF)
+
+
+# Register access methods wrapped by instrumentation and retry policies
+_ACCESS_METHODS = (
+    "_read_register",
+    "_write_register",
+    "_read_block",
+    "_read_block_into",
+    "_write_block",
+)
+
+
+class CAP1188_Snapshot:
+    """Decoded touch state from a single burst read of registers 0x00 to 0x17.
+    Returned by `CAP1188.snapshot`, which reuses the same instance on every call."""
+
+    def __init__(self) -> None:
+        self.main_control = 0
+        """Main Control register (0x00) at the time of the read."""
+        self.general_status = 0
+        """General Status register (0x02)."""
+        self.status = 0
+        """8 bit value representing touch state of all pins (0x03)."""
+        self.noise = 0
+        """8 bit value representing the noise flag of all pins (0x0A)."""
+        self.deltas = [0] * 8
+        """Signed delta count for pins 1 to 8 (0x10 to 0x17)."""
+
+    def _decode(self, buf: Union[bytearray, bytes]) -> None:
+        self.main_control = buf[_CAP1188_MAIN_CONTROL]
+        self.general_status = buf[_CAP1188_GENERAL_STATUS]
+        self.status = buf[_CAP1188_INPUT_STATUS]
+        self.noise = buf[_CAP1188_NOISE_FLAGS]
+        deltas = self.deltas
+        for i in range(8):
+            # 8 bit 2's complement
+            raw_value = buf[_CAP1188_DELTA_COUNT[0] + i]
+            deltas[i] = raw_value - 256 if raw_value & 128 else raw_value
+
+
+class CAP1188_Channel:
+    """Helper class to represent a touch channel on the CAP1188. Not meant to
+    be used directly."""
+
+    def __init__(self, cap1188: "CAP1188_Core", pin: int) -> None:
+        self._cap1188 = cap1188
+        self._pin = pin
+
+    @property
+    def value(self) -> bool:
+        """Whether the pin is being touched or not."""
+        if self._cap1188.snapshot_max_age:
+            return self._cap1188._recent_touched() & (1 << self._pin - 1) != 0
+        return self._cap1188.touched() & (1 << self._pin - 1) != 0
+
+    @property
+    def raw_value(self) -> int:
+        """The raw touch measurement."""
+        if self._cap1188.snapshot_max_age:
+            return self._cap1188._recent_snapshot().deltas[self._pin - 1]
+        return self._cap1188.delta_count(self._pin)
+
+    @property
+    def threshold(self) -> int:
+        """The touch threshold value."""
+        return self._cap1188._read_config(_CAP1188_THESHOLD_1 + self._pin - 1)
+
+    @threshold.setter
+    def threshold(self, value: int) -> None:
+        value = int(value)
+        if not 0 <= value <= 127:
+            raise ValueError("Threshold value must be in range 0 to 127.")
+        self._cap1188._write_config(_CAP1188_THESHOLD_1 + self._pin - 1, value)
+
+    def recalibrate(self) -> None:
+        """Perform a self recalibration."""
+        self._cap1188.recalibrate_pins(1 << self._pin - 1)
+
+
+class CAP1188_Core:
+    """CAP1188 driver core without the configuration API, must be extended
+    for I2C/SPI interfacing. Extend `adafruit_cap1188.cap1188.CAP1188` for the
+    full driver.
+
+    :param bool warm_start: Assume the sensor may still be configured from a
+        previous run: read back the settings the driver needs and only write
+        those that differ. Skipped steps are listed in `init_skipped`.
+    :param bool recalibrate: Whether to recalibrate all pins. Defaults to
+        `True`, or `False` on a warm start.
+    """
+
+    def __init__(self, warm_start: bool = False, recalibrate: Optional[bool] = None) -> None:
+        pid, mid = self._read_block(_CAP1188_PRODUCT_ID, 2)
+        if mid != _CAP1188_MID:
+            raise RuntimeError(f"Failed to find CAP1188! Manufacturer ID: 0x{mid:02x}")
+        if pid != _CAP1188_PID:
+            raise RuntimeError(f"Failed to find CAP1188! Product ID: 0x{pid:02x}")
+        self._channels = [None] * 8
+        self._snapshot = CAP1188_Snapshot()
+        self._snapshot_buf = bytearray(_CAP1188_SNAPSHOT_LEN)
+        self._snapshot_time = None
+        self._snapshot_touched = None
+        self._delta_buf = bytearray(8)
+        self.snapshot_max_age = 0
+        """Age in milliseconds up to which channel `CAP1188_Channel.value` and
+        `CAP1188_Channel.raw_value` reuse the most recent `snapshot` instead of
+        reading the bus. 0, the default, always reads the bus."""
+        self._instrumentation = None
+        self._retry_policy = None
+        skipped = []
+        if warm_start:
+            config = self._read_block(_CAP1188_MULTI_TOUCH_CFG, 6)
+            multi_touch = config[0]
+            recalibration = config[5]
+            led_linking = self._read_register(_CAP1188_LED_LINKING)
+        else:
+            multi_touch = recalibration = led_linking = None
+        if led_linking == 0xFF:
+            skipped.append("led_linking")
+        else:
+            self._write_register(_CAP1188_LED_LINKING, 0xFF)  # turn on LED linking
+        if multi_touch == 0x00:
+            skipped.append("multi_touch")
+        else:
+            self._write_register(_CAP1188_MULTI_TOUCH_CFG, 0x00)  # allow multi touch
+        if recalibration == 0x10:
+            skipped.append("recalibration_config")
+        else:
+            self._write_register(0x2F, 0x10)  # turn off input-1-sets-all-inputs feature
+        if recalibrate is None:
+            recalibrate = not warm_start
+        if recalibrate:
+            self.recalibrate()
+        else:
+            skipped.append("recalibrate")
+        self.init_skipped = tuple(skipped)
+        """Initialization steps skipped because the sensor was already set up:
+        any of ``"led_linking"``, ``"multi_touch"``, ``"recalibration_config"``
+        and ``"recalibrate"``."""
+
+    def __getitem__(self, key: int) -> CAP1188_Channel:
+        pin = key
+        index = key - 1
+        if pin < 1 or pin > 8:
+            raise IndexError("Pin must be a value 1-8.")
+        if self._channels[index] is None:
+            self._channels[index] = CAP1188_Channel(self, pin)
+        return self._channels[index]
+
+    @property
+    def touched_pins(self) -> Tuple[bool, bool, bool, bool, bool, bool, bool, bool]:
+        """A tuple of touched state for all pins."""
+        touched = self.touched()
+        return tuple(bool(touched >> i & 1) for i in range(8))
+
+    def touched_pins_into(self, result: List[bool]) -> List[bool]:
+        """Fill the caller owned list result (at least 8 long) with the touched
+        state of all pins, without allocating, and return it."""
+        touched = self.touched()
+        for i in range(8):
+            result[i] = bool(touched >> i & 1)
+        return result
+
+    def touched(self) -> int:
+        """Return 8 bit value representing touch state of all pins."""
+        # clear the INT bit and any previously touched pins
+        current = self._read_register(_CAP1188_MAIN_CONTROL)
+        self._write_register(_CAP1188_MAIN_CONTROL, current & ~0x01)
+        # return only currently touched pins
+        return self._read_register(_CAP1188_INPUT_STATUS)
+
+    def snapshot(self) -> CAP1188_Snapshot:
+        """Read touch status, noise flags and delta counts of all pins in a
+        single bus transaction. The INT bit is cleared afterwards if it was set,
+        so ``status`` may include touches latched since the previous call.
+        The returned object is reused and overwritten on the next call."""
+        snapshot = self._snapshot
+        self._read_block_into(_CAP1188_MAIN_CONTROL, self._snapshot_buf)
+        snapshot._decode(self._snapshot_buf)
+        if snapshot.main_control & 0x01:
+            self._write_register(_CAP1188_MAIN_CONTROL, snapshot.main_control & ~0x01)
+            # status included latched touches, current ones are read on demand
+            self._snapshot_touched = None
+        else:
+            self._snapshot_touched = snapshot.status
+        if self.snapshot_max_age:
+            self._snapshot_time = time.monotonic_ns() // 1000000
+        return snapshot
+
+    def _recent_snapshot(self) -> CAP1188_Snapshot:
+        """Return the last snapshot if younger than snapshot_max_age, else a new one."""
+        if (
+            self._snapshot_time is not None
+            and time.monotonic_ns() // 1000000 - self._snapshot_time < self.snapshot_max_age
+        ):
+            return self._snapshot
+        return self.snapshot()
+
+    def _recent_touched(self) -> int:
+        """Return the currently touched pins like `touched`, based on a recent
+        snapshot. Costs one status read if that snapshot had latched touches."""
+        self._recent_snapshot()
+        if self._snapshot_touched is None:
+            self._snapshot_touched = self._read_register(_CAP1188_INPUT_STATUS)
+        return self._snapshot_touched
+
+    def values(self, mask: int = 0xFF) -> int:
+        """Return the touch state of the pins in mask as an 8 bit value, the
+        same as `touched`. Uses a recent `snapshot` if `snapshot_max_age`
+        allows."""
+        if self.snapshot_max_age:
+            return self._recent_touched() & mask
+        return self.touched() & mask
+
+    def raw_values(self, result: Optional[List[int]] = None) -> List[int]:
+        """Return the signed delta counts of all pins, read with a single block
+        read. If result, a caller owned list of 8, is given it is filled
+        instead and returned."""
+        if result is None:
+            result = [0] * 8
+        buf = self._delta_buf
+        self._read_block_into(_CAP1188_DELTA_COUNT[0], buf)
+        for i in range(8):
+            # 8 bit 2's complement
+            result[i] = buf[i] - 256 if buf[i] & 128 else buf[i]
+        return result
+
+    def recalibrate(self) -> None:
+        """Perform a self recalibration on all the pins."""
+        self.recalibrate_pins(0xFF)
+
+    def delta_count(self, pin: int) -> int:
+        """Return the 8 bit delta count value for the channel."""
+        if pin < 1 or pin > 8:
+            raise IndexError("Pin must be a value 1-8.")
+        # 8 bit 2's complement
+        raw_value = self._read_register(_CAP1188_DELTA_COUNT[pin - 1])
+        raw_value = raw_value - 256 if raw_value & 128 else raw_value
+        return raw_value
+
+    def recalibrate_pins(self, mask: int) -> None:
+        """Recalibrate pins specified by bit mask."""
+        self._write_register(_CAP1188_CAL_ACTIVATE, mask)
+
+    def invalidate(self) -> None:
+        """Mark cached configuration registers as stale. The base driver
+        caches nothing; see `adafruit_cap1188.settings.CAP1188_Settings`."""
+
+    def _read_config(self, address: int) -> int:
+        """Return 8 bit value of configuration register."""
+        return self._read_register(address)
+
+    def _write_config(self, address: int, value: int) -> None:
+        """Write 8 bit value to configuration register."""
+        self._write_register(address, value)
+
+    def enable_instrumentation(
+        self, callback: Optional[Callable[[str, int, int, int], None]] = None
+    ) -> "CAP1188_Instrumentation":
+        """Start counting bus traffic and return the
+        `adafruit_cap1188.instrument.CAP1188_Instrumentation` holding the
+        counters. A driver without instrumentation has no extra overhead."""
+        from adafruit_cap1188.instrument import CAP1188_Instrumentation  # noqa: PLC0415
+
+        self._instrumentation = CAP1188_Instrumentation(self, callback)
+        self._wrap_access()
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Stop counting bus traffic."""
+        self._instrumentation = None
+        self._wrap_access()
+
+    def enable_retries(
+        self,
+        retries: int = 3,
+        backoff_ms: int = 1,
+        max_backoff_ms: int = 8,
+        budget_ms: int = 20,
+    ) -> "CAP1188_RetryPolicy":
+        """Retry register accesses failing with `OSError` and return the
+        `adafruit_cap1188.retry.CAP1188_RetryPolicy` holding the counters.
+        See there for the parameters."""
+        from adafruit_cap1188.retry import CAP1188_RetryPolicy  # noqa: PLC0415
+
+        self._retry_policy = CAP1188_RetryPolicy(
+            self, retries, backoff_ms, max_backoff_ms, budget_ms
+        )
+        self._wrap_access()
+        return self._retry_policy
+
+    def disable_retries(self) -> None:
+        """Let bus errors propagate immediately again."""
+        self._retry_policy = None
+        self._wrap_access()
+
+    def _wrap_access(self) -> None:
+        """Rebuild the register access methods of this instance from the
+        enabled layers: the retry policy around the instrumentation around the
+        transport. Without layers the class methods are used directly."""
+        for name in _ACCESS_METHODS:
+            if name in self.__dict__:
+                delattr(self, name)
+        for layer in (self._instrumentation, self._retry_policy):
+            if layer is not None:
+                for name in _ACCESS_METHODS:
+                    setattr(self, name, layer._wrap(name, getattr(self, name)))
+
+    def _read_register(self, address: int) -> int:
+        """Return 8 bit value of register at address."""
+        raise NotImplementedError
+
+    def _write_register(self, address: int, value: int) -> None:
+        """Write 8 bit value to register at address."""
+        raise NotImplementedError
+
+    def _read_block(self, start: int, length: int) -> bytearray:
+        """Return byte array of values from start address to length."""
+        raise NotImplementedError
+
+    def _read_block_into(self, start: int, buf: bytearray) -> None:
+        """Fill buf with values beginning at start address. Transports should
+        override this to read without allocating."""
+        buf[:] = self._read_block(start, len(buf))
+
+    def _write_block(self, start: int, data: Union[bytearray, bytes]) -> None:
+        """Write out data beginning at start address."""
+        raise NotImplementedError
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.events`
+====================================================
+
+Interrupt driven touch press and release events for the CAP1188.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The CAP1188 asserts its ALERT (IRQ) output, active low, whenever a touch
+or release is detected. While the line is idle no bus traffic is generated.
+
+"""
+
+from micropython import const
+
+try:
+    from typing import Optional, Tuple
+
+    from digitalio import DigitalInOut
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_MAIN_CONTROL = const(0x00)
+_CAP1188_INPUT_STATUS = const(0x03)
+
+_PRESS = const(0x80)
+
+
+class CAP1188_Events:
+    """Press and release events for all pins of a CAP1188, buffered in a
+    fixed size ring buffer.
+
+    :param CAP1188 cap1188: The sensor to read.
+    :param DigitalInOut alert: Optional input connected to the ALERT pin. When
+        given, the sensor is only read while the line is asserted (low).
+    :param int size: Maximum number of buffered events. When full, the oldest
+        event is dropped and `overflows` is incremented.
+    """
+
+    def __init__(
+        self, cap1188: "CAP1188", alert: Optional["DigitalInOut"] = None, size: int = 16
+    ) -> None:
+        self._cap1188 = cap1188
+        self._alert = alert
+        self._events = bytearray(size)
+        self._head = 0
+        self._count = 0
+        self._last = 0
+        self._buf = bytearray(_CAP1188_INPUT_STATUS + 1)
+        self.overflows = 0
+        """Number of events dropped because the buffer was full."""
+
+    @property
+    def touched(self) -> int:
+        """8 bit value representing touch state of all pins as of the last update."""
+        return self._last
+
+    def update(self) -> bool:
+        """Read the sensor if an interrupt is pending and queue any press or
+        release events. Returns whether new events were queued."""
+        if self._alert is not None and self._alert.value:
+            return False
+        cap = self._cap1188
+        # main control and the latched input status in one burst
+        buf = self._buf
+        cap._read_block_into(_CAP1188_MAIN_CONTROL, buf)
+        if not buf[_CAP1188_MAIN_CONTROL] & 0x01:
+            return False
+        latched = buf[_CAP1188_INPUT_STATUS]
+        cap._write_register(_CAP1188_MAIN_CONTROL, buf[_CAP1188_MAIN_CONTROL] & ~0x01)
+        # pins released before the INT bit was cleared will not interrupt again
+        current = cap._read_register(_CAP1188_INPUT_STATUS)
+        last = self._last
+        pressed = latched & ~last
+        released = (last | latched) & ~current
+        self._last = current
+        for i in range(8):
+            if pressed >> i & 1:
+                self._push(i + 1 | _PRESS)
+        for i in range(8):
+            if released >> i & 1:
+                self._push(i + 1)
+        return bool(pressed | released)
+
+    def _push(self, event: int) -> None:
+        size = len(self._events)
+        if self._count == size:
+            self._head = (self._head + 1) % size
+            self._count -= 1
+            self.overflows += 1
+        self._events[(self._head + self._count) % size] = event
+        self._count += 1
+
+    def get(self) -> Optional[Tuple[int, bool]]:
+        """Return the oldest event as a ``(pin, pressed)`` tuple, or `None` if
+        no event is queued."""
+        if not self._count:
+            return None
+        event = self._events[self._head]
+        self._head = (self._head + 1) % len(self._events)
+        self._count -= 1
+        return (event & 0x0F, bool(event & _PRESS))
+
+    def clear(self) -> None:
+        """Discard all queued events."""
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.gestures`
+====================================================
+
+Debounced press, release, long hold and auto repeat detection for all 8
+CAP1188 pins at once.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The engine is fed the packed 8 bit touch status, e.g. from
+`CAP1188.snapshot`, and reports events as 8 bit masks, one bit per pin, so
+a frame without any change costs a handful of integer operations::
+
+    gestures = CAP1188_Gestures()
+    while True:
+        if gestures.update(cap.snapshot().status):
+            print(gestures.pressed, gestures.released, gestures.held, gestures.repeated)
+
+"""
+
+import time
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+
+class CAP1188_Gestures:
+    """Touch state machine for 8 pins.
+
+    :param int press_frames: Consecutive frames a pin must read touched before
+        it counts as pressed.
+    :param int release_frames: Consecutive frames a pin must read untouched
+        before it counts as released. Use a larger value than press_frames for
+        hysteresis against flickering releases.
+    :param int hold_ms: Time a pin must stay pressed to report a long hold.
+    :param int repeat_ms: Interval of auto repeat events after a long hold,
+        or 0 to disable auto repeat.
+    """
+
+    def __init__(
+        self,
+        press_frames: int = 2,
+        release_frames: int = 2,
+        hold_ms: int = 500,
+        repeat_ms: int = 100,
+    ) -> None:
+        if press_frames < 1 or release_frames < 1:
+            raise ValueError("Frame counts must be at least 1.")
+        self._press_frames = press_frames
+        self._release_frames = release_frames
+        self._history_mask = (1 << 8 * max(press_frames, release_frames)) - 1
+        self._history = 0
+        self.hold_ms = hold_ms
+        """Time a pin must stay pressed to report a long hold."""
+        self.repeat_ms = repeat_ms
+        """Interval of auto repeat events after a long hold, 0 to disable."""
+        self._deadlines = [0] * 8
+        self._next_deadline = None
+        self._holding = 0
+        self.state = 0
+        """Debounced touch state of all pins."""
+        self.pressed = 0
+        """Pins pressed in the last update."""
+        self.released = 0
+        """Pins released in the last update."""
+        self.held = 0
+        """Pins that reached the long hold time in the last update."""
+        self.repeated = 0
+        """Pins that generated an auto repeat in the last update."""
+
+    def update(self, status: int, now: Optional[int] = None) -> bool:
+        """Feed one frame of packed touch status. now is the time in
+        milliseconds, read from the monotonic clock if not given. Returns
+        whether any event mask is non zero."""
+        if now is None:
+            now = time.monotonic_ns() // 1000000
+        history = (self._history << 8 | status) & self._history_mask
+        self._history = history
+        touched = 0xFF
+        for _ in range(self._press_frames):
+            touched &= history
+            history >>= 8
+        history = self._history
+        untouched = 0xFF
+        for _ in range(self._release_frames):
+            untouched &= ~history
+            history >>= 8
+        state = self.state
+        new_state = (state | touched) & ~untouched & 0xFF
+        pressed = new_state & ~state
+        released = state & ~new_state
+        self.state = new_state
+        self.pressed = pressed
+        self.released = released
+        self._holding &= ~released
+        held = 0
+        repeated = 0
+        if pressed:
+            for i in range(8):
+                if pressed >> i & 1:
+                    self._deadlines[i] = now + self.hold_ms
+            self._update_next_deadline()
+        elif released:
+            self._update_next_deadline()
+        if self._next_deadline is not None and now >= self._next_deadline:
+            deadlines = self._deadlines
+            for i in range(8):
+                bit = 1 << i
+                # no hold or repeat while a release is being debounced
+                if new_state & status & bit and 0 <= deadlines[i] <= now:
+                    if self._holding & bit:
+                        repeated |= bit
+                    else:
+                        held |= bit
+                        self._holding |= bit
+                    # a deadline of -1 stops further events when auto repeat is off
+                    deadlines[i] = now + self.repeat_ms if self.repeat_ms else -1
+            self._update_next_deadline()
+        self.held = held
+        self.repeated = repeated
+        return bool(pressed | released | held | repeated)
+
+    def _update_next_deadline(self) -> None:
+        next_deadline = None
+        for i in range(8):
+            deadline = self._deadlines[i]
+            if self.state >> i & 1 and deadline >= 0:
+                if next_deadline is None or deadline < next_deadline:
+                    next_deadline = deadline
+        self._next_deadline = next_deadline
+
+    def reset(self) -> None:
+        """Forget all history and report every pin as released."""
+        self._history = 0
+        self._holding = 0
+        self._next_deadline = None
+        self.state = 0
+        self.pressed = self.released = self.held = self.repeated = 0
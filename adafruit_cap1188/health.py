@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.health`
+====================================================
+
+Noise, drift and calibration health monitoring with targeted recalibration.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Each update reads the touch snapshot, which includes the General Status
+(0x02) and Noise Flag Status (0x0A) registers, in one burst. The delta
+baseline of every untouched pin is tracked with an integer moving average.
+Pins that drift beyond a limit, or stay noisy for several frames, are
+recalibrated together with `CAP1188.recalibrate_pins`, at most once per
+``min_interval_ms``, so healthy pins keep sensing.
+
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_BC_OUT = const(0x40)
+_ACAL_FAIL = const(0x20)
+
+
+class CAP1188_HealthMonitor:
+    """Watch all pins of a CAP1188 and recalibrate only the unhealthy ones.
+
+    :param CAP1188 cap1188: The sensor to monitor.
+    :param int drift_limit: Absolute baseline delta count of an untouched pin
+        that triggers its recalibration.
+    :param int noise_frames: Consecutive frames a pin's noise flag must be set
+        to trigger its recalibration.
+    :param int min_interval_ms: Minimum time between recalibrations.
+    :param int smoothing: Baseline averaging weight as a power of two; the
+        baseline moves 1/2**smoothing of the way to each new delta.
+    :param int degraded_limit: Recalibrations after which a pin is reported in
+        `degraded`.
+    """
+
+    def __init__(
+        self,
+        cap1188: "CAP1188",
+        drift_limit: int = 8,
+        noise_frames: int = 10,
+        min_interval_ms: int = 5000,
+        smoothing: int = 4,
+        degraded_limit: int = 5,
+    ) -> None:
+        self._cap1188 = cap1188
+        self.drift_limit = drift_limit
+        """Baseline delta count that triggers recalibration."""
+        self.noise_frames = noise_frames
+        """Consecutive noisy frames that trigger recalibration."""
+        self.min_interval_ms = min_interval_ms
+        """Minimum time between recalibrations."""
+        self.degraded_limit = degraded_limit
+        """Recalibrations after which a pin counts as degraded."""
+        self._smoothing = smoothing
+        self._baseline = [0] * 8
+        self._noisy_frames = bytearray(8)
+        self._last_recalibration = None
+        self.noise_counts = [0] * 8
+        """Frames each pin reported noise."""
+        self.recalibrations = [0] * 8
+        """Recalibrations triggered for each pin."""
+        self.base_count_errors = 0
+        """Frames reporting a base count out of limit (BC_OUT)."""
+        self.calibration_failures = 0
+        """Frames reporting a failed analog calibration (ACAL_FAIL)."""
+        self.pending = 0
+        """Pins waiting for recalibration because of the rate limit."""
+
+    def baseline(self, pin: int) -> int:
+        """Smoothed delta count of pin (1-8) while untouched."""
+        return self._baseline[pin - 1] >> self._smoothing
+
+    @property
+    def degraded(self) -> int:
+        """8 bit mask of pins recalibrated at least `degraded_limit` times."""
+        mask = 0
+        for i in range(8):
+            if self.recalibrations[i] >= self.degraded_limit:
+                mask |= 1 << i
+        return mask
+
+    def update(self) -> int:
+        """Read one snapshot, update the statistics and recalibrate unhealthy
+        pins if allowed. Returns the mask of pins recalibrated."""
+        snapshot = self._cap1188.snapshot()
+        if snapshot.general_status & _BC_OUT:
+            self.base_count_errors += 1
+        if snapshot.general_status & _ACAL_FAIL:
+            self.calibration_failures += 1
+        shift = self._smoothing
+        deltas = snapshot.deltas
+        for i in range(8):
+            bit = 1 << i
+            if snapshot.noise & bit:
+                self.noise_counts[i] += 1
+                if self._noisy_frames[i] < 255:
+                    self._noisy_frames[i] += 1
+            else:
+                self._noisy_frames[i] = 0
+            if not snapshot.status & bit:
+                # fixed point average, scaled by 2**shift
+                self._baseline[i] += deltas[i] - (self._baseline[i] >> shift)
+            baseline = self._baseline[i] >> shift
+            if (
+                baseline >= self.drift_limit
+                or -baseline >= self.drift_limit
+                or self._noisy_frames[i] >= self.noise_frames
+            ):
+                self.pending |= bit
+        if not self.pending:
+            return 0
+        now = time.monotonic_ns() // 1000000
+        if (
+            self._last_recalibration is not None
+            and now - self._last_recalibration < self.min_interval_ms
+        ):
+            return 0
+        mask = self.pending
+        self._cap1188.recalibrate_pins(mask)
+        self._last_recalibration = now
+        self.pending = 0
+        for i in range(8):
+            if mask >> i & 1:
+                self.recalibrations[i] += 1
+                self._baseline[i] = 0
+                self._noisy_frames[i] = 0
+        return mask
@@ -34,7 +34,7 @@ from micropython import const
 from adafruit_cap1188.cap1188 import CAP1188
 
 try:
-    from typing import Union
+    from typing import Optional, Union
 
     from busio import I2C
 except ImportError:
@@ -44,15 +44,23 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
 
 _CAP1188_DEFAULT_ADDRESS = const(0x29)
+_CAP1188_BLOCK_MAX = const(32)
 
 
 class CAP1188_I2C(CAP1188):
     """Driver for the CAP1188 connected over I2C."""
 
-    def __init__(self, i2c: I2C, address: int = _CAP1188_DEFAULT_ADDRESS) -> None:
+    def __init__(
+        self,
+        i2c: I2C,
+        address: int = _CAP1188_DEFAULT_ADDRESS,
+        warm_start: bool = False,
+        recalibrate: Optional[bool] = None,
+    ) -> None:
         self._i2c = i2c_device.I2CDevice(i2c, address)
         self._buf = bytearray(2)
-        super().__init__()
+        self._block_buf = bytearray(1 + _CAP1188_BLOCK_MAX)
+        super().__init__(warm_start, recalibrate)
 
     def _read_register(self, address: int) -> int:
         """Return 8 bit value of register at address."""
@@ -71,12 +79,25 @@ class CAP1188_I2C(CAP1188):
     def _read_block(self, start: int, length: int) -> bytearray:
         """Return byte array of values from start address to length."""
         result = bytearray(length)
-        with self._i2c as i2c:
-            i2c.write(bytes((start,)))
-            i2c.readinto(result)
+        self._read_block_into(start, result)
         return result
 
+    def _read_block_into(self, start: int, buf: bytearray) -> None:
+        """Fill buf with values beginning at start address."""
+        self._buf[0] = start
+        with self._i2c as i2c:
+            i2c.write_then_readinto(self._buf, buf, out_end=1)
+
     def _write_block(self, start: int, data: Union[bytearray, bytes]) -> None:
         """Write out data beginning at start address."""
+        length = len(data)
+        if length > _CAP1188_BLOCK_MAX:
+            with self._i2c as i2c:
+                i2c.write(bytes((start,)) + data)
+            return
+        block = self._block_buf
+        block[0] = start
+        for i in range(length):
+            block[1 + i] = data[i]
         with self._i2c as i2c:
-            i2c.write(bytes((start,)) + data)
+            i2c.write(block, end=1 + length)
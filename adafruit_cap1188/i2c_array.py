@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.i2c_array`
+====================================================
+
+Frame based polling of several CAP1188 sensors sharing one I2C bus.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+* Adafruit's Bus Device library:
+  https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+
+"""
+
+import time
+
+from micropython import const
+
+from adafruit_cap1188.i2c import CAP1188_I2C
+
+try:
+    from typing import Sequence
+
+    from busio import I2C
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_MAIN_CONTROL = const(0x00)
+_CAP1188_INPUT_STATUS = const(0x03)
+_CAP1188_DELTA_COUNT_1 = const(0x10)
+_CAP1188_FRAME_LEN = const(0x18)
+
+
+class CAP1188Array:
+    """Several CAP1188 sensors on one I2C bus, read together as a frame.
+    Each frame takes the bus lock once and reads each sensor with a single
+    burst.
+
+    :param I2C i2c: The I2C bus the sensors are connected to.
+    :param Sequence[int] addresses: The I2C addresses of the sensors, in the
+        order their pins appear in `touched`.
+    """
+
+    def __init__(self, i2c: I2C, addresses: Sequence[int]) -> None:
+        self._i2c = i2c
+        self._addresses = tuple(addresses)
+        self._devices = tuple(CAP1188_I2C(i2c, address) for address in self._addresses)
+        self._register = bytearray(1)
+        self._status_register = bytearray((_CAP1188_INPUT_STATUS,))
+        self._status = bytearray(1)
+        self._out = bytearray(2)
+        self._buf = bytearray(_CAP1188_FRAME_LEN)
+        self.touched = 0
+        """Touch state of all sensors from the last frame, packed 8 bits per
+        sensor with the first sensor in the lowest byte. Like
+        `CAP1188.touched`, only pins touched at the time of the frame are set."""
+        self.deltas = [[0] * 8 for _ in self._addresses]
+        """Signed delta counts from the last frame, one row of 8 per sensor."""
+        self.latency_ns = 0
+        """Duration of the last frame in nanoseconds."""
+        self.max_latency_ns = 0
+        """Longest frame duration seen in nanoseconds."""
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __getitem__(self, index: int) -> CAP1188_I2C:
+        """The driver of the sensor at index, for configuration."""
+        return self._devices[index]
+
+    def update(self) -> int:
+        """Read one frame from all sensors and return the packed touch state."""
+        start = time.monotonic_ns()
+        i2c = self._i2c
+        buf = self._buf
+        out = self._out
+        status = self._status
+        touched = 0
+        while not i2c.try_lock():
+            pass
+        try:
+            for index, address in enumerate(self._addresses):
+                i2c.writeto_then_readfrom(address, self._register, buf)
+                main_control = buf[_CAP1188_MAIN_CONTROL]
+                status[0] = buf[_CAP1188_INPUT_STATUS]
+                if main_control & 0x01:
+                    # the status includes latched touches: clear the INT bit so
+                    # released pins drop out, and read the current ones
+                    out[0] = _CAP1188_MAIN_CONTROL
+                    out[1] = main_control & ~0x01
+                    i2c.writeto(address, out)
+                    i2c.writeto_then_readfrom(address, self._status_register, status)
+                touched |= status[0] << 8 * index
+                row = self.deltas[index]
+                for i in range(8):
+                    # 8 bit 2's complement
+                    raw_value = buf[_CAP1188_DELTA_COUNT_1 + i]
+                    row[i] = raw_value - 256 if raw_value & 128 else raw_value
+        finally:
+            i2c.unlock()
+        self.touched = touched
+        self.latency_ns = time.monotonic_ns() - start
+        self.max_latency_ns = max(self.max_latency_ns, self.latency_ns)
+        return touched
+
+    def is_touched(self, sensor: int, pin: int) -> bool:
+        """Whether pin (1-8) of the sensor at index sensor was touched in the
+        last frame."""
+        return bool(self.touched >> 8 * sensor + pin - 1 & 1)
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.instrument`
+====================================================
+
+Bus transaction counters, latency histograms and trace hooks for a CAP1188.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Instrumentation wraps the register access methods of one driver instance
+with counting wrappers, which the driver removes again when instrumentation
+is disabled, so a driver that is not instrumented runs exactly the original
+code. Use `CAP1188.enable_instrumentation` rather than creating this class
+directly.
+
+Each access is attributed to the call that entered the driver package, found
+by walking the interpreter stack, so `CAP1188_Instrumentation.summary` shows
+which public API really generated the traffic. CircuitPython has no
+``sys._getframe``; there accesses are counted without attribution.
+
+"""
+
+import time
+from array import array
+
+from micropython import const
+
+try:
+    from typing import Callable, Optional
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+try:
+    from sys import _getframe
+except ImportError:
+    _getframe = None
+
+# path prefix of the driver package's modules
+_PACKAGE = __file__[: __file__.rfind("instrument")]
+
+_BUCKETS = const(16)
+
+_SIZE_BYTE = const(0)
+_SIZE_LENGTH = const(1)
+_SIZE_BUFFER = const(2)
+
+# register access method -> whether it writes, and how its transfer size is given
+_METHODS = {
+    "_read_register": (False, _SIZE_BYTE),
+    "_write_register": (True, _SIZE_BYTE),
+    "_read_block": (False, _SIZE_LENGTH),
+    "_read_block_into": (False, _SIZE_BUFFER),
+    "_write_block": (True, _SIZE_BUFFER),
+}
+
+
+def _caller() -> str:
+    """Name of the outermost function of the driver package on the stack."""
+    if _getframe is None:
+        return ""
+    frame = _getframe(1)
+    caller = ""
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE):
+        code = frame.f_code
+        caller = getattr(code, "co_qualname", code.co_name)
+        frame = frame.f_back
+    return caller
+
+
+class CAP1188_Instrumentation:
+    """Per register read and write counters and latency histograms for one
+    driver.
+
+    :param CAP1188 cap1188: The driver to instrument.
+    :param callback: Optional function called after every bus access as
+        ``callback(method_name, address, length, elapsed_ns)``.
+    """
+
+    def __init__(
+        self,
+        cap1188: "CAP1188",
+        callback: Optional[Callable[[str, int, int, int], None]] = None,
+    ) -> None:
+        self._cap1188 = cap1188
+        self.callback = callback
+        """Function called after every bus access, including failed ones, or
+        `None`."""
+        self.reads = array("L", [0] * 256)
+        """Read transactions by starting register address."""
+        self.writes = array("L", [0] * 256)
+        """Write transactions by starting register address."""
+        self.errors = array("L", [0] * 256)
+        """Transactions that failed with an exception, such as a bus error, by
+        starting register address. They are counted in `reads` or `writes`
+        and the latency histograms too, but not in the byte totals."""
+        self.bytes_read = 0
+        """Total register bytes read."""
+        self.bytes_written = 0
+        """Total register bytes written."""
+        self.read_latency = array("L", [0] * _BUCKETS)
+        """Histogram of read latency: bucket n counts accesses taking less
+        than 2**n microseconds, the last bucket counts everything slower."""
+        self.write_latency = array("L", [0] * _BUCKETS)
+        """Histogram of write latency, bucketed like `read_latency`."""
+        self.callers = {}
+        """Transactions by ``(address, caller)``, where caller is the driver
+        function the application called, e.g. ``"CAP1188.snapshot"``."""
+        self._depth = 0
+
+    def reset(self) -> None:
+        """Zero all counters and histograms."""
+        for counters in (
+            self.reads,
+            self.writes,
+            self.errors,
+            self.read_latency,
+            self.write_latency,
+        ):
+            for i in range(len(counters)):
+                counters[i] = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.callers = {}
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        is_write, size = _METHODS[name]
+
+        def wrapper(address, *args):
+            # nested calls (e.g. _read_block using _read_block_into) count once
+            self._depth += 1
+            start = time.monotonic_ns()
+            failed = True
+            try:
+                result = method(address, *args)
+                failed = False
+            finally:
+                self._depth -= 1
+                if not self._depth:
+                    if size == _SIZE_LENGTH:
+                        length = args[0]
+                    elif size == _SIZE_BUFFER:
+                        length = len(args[0])
+                    else:
+                        length = 1
+                    elapsed = time.monotonic_ns() - start
+                    self._record(name, is_write, address, length, elapsed, failed)
+            return result
+
+        return wrapper
+
+    def _record(
+        self, name: str, is_write: bool, address: int, length: int, elapsed: int, failed: bool
+    ) -> None:
+        if failed:
+            self.errors[address] += 1
+        if is_write:
+            self.writes[address] += 1
+            if not failed:
+                self.bytes_written += length
+            histogram = self.write_latency
+        else:
+            self.reads[address] += 1
+            if not failed:
+                self.bytes_read += length
+            histogram = self.read_latency
+        bucket = 0
+        micros = elapsed // 1000
+        while micros and bucket < _BUCKETS - 1:
+            micros >>= 1
+            bucket += 1
+        histogram[bucket] += 1
+        key = (address, _caller())
+        self.callers[key] = self.callers.get(key, 0) + 1
+        if self.callback is not None:
+            self.callback(name, address, length, elapsed)
+
+    def summary(self) -> str:
+        """A table of the traffic to each register, with the calls that
+        generated it, most frequent first."""
+        lines = ["reg  reads  writes  errors  called from"]
+        for address in range(256):
+            if self.reads[address] or self.writes[address]:
+                callers = sorted(
+                    (-count, caller)
+                    for (key, caller), count in self.callers.items()
+                    if key == address and caller
+                )
+                lines.append(
+                    f"0x{address:02x} {self.reads[address]:6} {self.writes[address]:7} "
+                    f"{self.errors[address]:7}  "
+                    + ", ".join(f"{caller} {-count}" for count, caller in callers)
+                )
+        lines.append(f"bytes read: {self.bytes_read}, bytes written: {self.bytes_written}")
+        return "\n".join(lines)
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.recorder`
+====================================================
+
+Capture of timestamped CAP1188 delta count frames to a compact binary log.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Each frame is a fixed 14 byte little endian record: a 32 bit millisecond
+timestamp, the input status byte, the noise flag byte and the 8 signed delta
+counts. A log file starts with a 6 byte header: ``b"C188"``, the format
+version and the record size.
+
+"""
+
+import struct
+import time
+
+from micropython import const
+
+try:
+    from typing import BinaryIO, Tuple
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_MAGIC = b"C188"
+_VERSION = const(1)
+_HEADER_FORMAT = "<4sBB"
+_HEADER_SIZE = const(6)
+_RECORD_FORMAT = "<IBB8b"
+_RECORD_SIZE = const(14)
+
+
+class CAP1188_Recorder:
+    """Record delta count frames from a CAP1188 into a fixed size ring buffer.
+
+    :param CAP1188 cap1188: The sensor to record.
+    :param int size: Number of frames held before the oldest is overwritten.
+    """
+
+    def __init__(self, cap1188: "CAP1188", size: int = 64) -> None:
+        self._cap1188 = cap1188
+        self._size = size
+        self._ring = bytearray(size * _RECORD_SIZE)
+        self._view = memoryview(self._ring)
+        self._head = 0
+        self._count = 0
+        self.dropped = 0
+        """Number of frames overwritten before they were flushed."""
+
+    def __len__(self) -> int:
+        return self._count
+
+    def capture(self) -> None:
+        """Read one frame from the sensor and append it to the buffer."""
+        snapshot = self._cap1188.snapshot()
+        deltas = snapshot.deltas
+        if self._count == self._size:
+            self._head = (self._head + 1) % self._size
+            self._count -= 1
+            self.dropped += 1
+        index = (self._head + self._count) % self._size
+        struct.pack_into(
+            _RECORD_FORMAT,
+            self._ring,
+            index * _RECORD_SIZE,
+            time.monotonic_ns() // 1000000 & 0xFFFFFFFF,
+            snapshot.status,
+            snapshot.noise,
+            deltas[0],
+            deltas[1],
+            deltas[2],
+            deltas[3],
+            deltas[4],
+            deltas[5],
+            deltas[6],
+            deltas[7],
+        )
+        self._count += 1
+
+    def flush(self, stream: BinaryIO) -> int:
+        """Write the buffered frames, oldest first, to the binary stream and
+        empty the buffer. A header is written first if the stream is at its
+        start. Returns the number of frames written."""
+        if stream.tell() == 0:
+            stream.write(struct.pack(_HEADER_FORMAT, _MAGIC, _VERSION, _RECORD_SIZE))
+        count = self._count
+        first = min(count, self._size - self._head)
+        stream.write(self._view[self._head * _RECORD_SIZE : (self._head + first) * _RECORD_SIZE])
+        if count > first:
+            stream.write(self._view[: (count - first) * _RECORD_SIZE])
+        self._head = 0
+        self._count = 0
+        return count
+
+
+class CAP1188_LogReader:
+    """Memory map a log written by `CAP1188_Recorder` for reading. Only
+    available where the ``mmap`` module is, such as on Linux.
+
+    :param str path: The log file to open.
+    """
+
+    def __init__(self, path: str) -> None:
+        import mmap  # noqa: PLC0415
+
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = struct.unpack_from(_HEADER_FORMAT, self._map)
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD_SIZE:
+            self._map.close()
+            raise ValueError("Not a CAP1188 capture log.")
+        self._view = memoryview(self._map)
+        self._length = (len(self._map) - _HEADER_SIZE) // _RECORD_SIZE
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> memoryview:
+        """The raw record at index, as a zero copy slice of the file."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Frame index out of range.")
+        offset = _HEADER_SIZE + index * _RECORD_SIZE
+        return self._view[offset : offset + _RECORD_SIZE]
+
+    def frame(self, index: int) -> Tuple[int, ...]:
+        """Decode the record at index into ``(timestamp_ms, status, noise,
+        delta_1, ..., delta_8)``."""
+        return struct.unpack_from(_RECORD_FORMAT, self[index])
+
+    def close(self) -> None:
+        """Unmap the file. Slices returned by indexing must be released first."""
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> "CAP1188_LogReader":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
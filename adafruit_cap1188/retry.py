@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.retry`
+====================================================
+
+Bus error retries with backoff and a latency budget for CAP1188 drivers.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The policy wraps the register access methods of one driver instance, outside
+any `adafruit_cap1188.instrument` wrappers, so instrumentation counts every
+attempt, failed ones in
+`adafruit_cap1188.instrument.CAP1188_Instrumentation.errors`. Use
+`CAP1188.enable_retries` rather than creating this class directly. An
+`OSError` from the bus, such as a NACK, is retried after a doubling delay
+for as long as the call stays within its latency budget; only then is it
+raised. After a recovered error the configuration cache and the recent
+snapshot are dropped, since a failed transfer may or may not have reached
+the device, so the next access reads the true state. The sensor is not
+recalibrated.
+
+"""
+
+import time
+
+try:
+    from typing import Callable
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+
+class CAP1188_RetryPolicy:
+    """Retry failed register accesses of one driver.
+
+    :param CAP1188 cap1188: The driver to protect.
+    :param int retries: Maximum number of retries of one call.
+    :param int backoff_ms: Delay before the first retry, doubled for each
+        further retry.
+    :param int max_backoff_ms: Upper limit of the delay between retries.
+    :param int budget_ms: Longest time one call may take including retries;
+        no retry is started that would wait beyond it.
+    """
+
+    def __init__(
+        self,
+        cap1188: "CAP1188",
+        retries: int = 3,
+        backoff_ms: int = 1,
+        max_backoff_ms: int = 8,
+        budget_ms: int = 20,
+    ) -> None:
+        self._cap1188 = cap1188
+        self.retries = retries
+        """Maximum number of retries of one call."""
+        self.backoff_ms = backoff_ms
+        """Delay before the first retry in milliseconds."""
+        self.max_backoff_ms = max_backoff_ms
+        """Upper limit of the delay between retries in milliseconds."""
+        self.budget_ms = budget_ms
+        """Longest time one call may take including retries."""
+        self.errors = 0
+        """Bus errors seen, including those recovered by a retry."""
+        self.recoveries = 0
+        """Calls that succeeded after at least one retry."""
+        self.failures = 0
+        """Calls that raised after retries or budget ran out."""
+        self._depth = 0
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        self.errors = 0
+        self.recoveries = 0
+        self.failures = 0
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        def wrapper(*args):
+            # nested calls (e.g. _read_block using _read_block_into) are
+            # retried by the outermost one
+            if self._depth:
+                return method(*args)
+            self._depth += 1
+            try:
+                return self._call(method, args)
+            finally:
+                self._depth -= 1
+
+        return wrapper
+
+    def _call(self, method: Callable, args: tuple):
+        start = time.monotonic_ns() // 1000000
+        backoff = self.backoff_ms
+        attempt = 0
+        while True:
+            try:
+                result = method(*args)
+            except OSError:
+                self.errors += 1
+                elapsed = time.monotonic_ns() // 1000000 - start
+                if attempt >= self.retries or elapsed + backoff > self.budget_ms:
+                    self.failures += 1
+                    self._resync()
+                    raise
+                attempt += 1
+                time.sleep(backoff / 1000)
+                backoff = min(backoff * 2, self.max_backoff_ms)
+                continue
+            if attempt:
+                self.recoveries += 1
+                self._resync()
+            return result
+
+    def _resync(self) -> None:
+        self._cap1188.invalidate()
+        self._cap1188._snapshot_time = None
@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.service`
+====================================================
+
+Sensor service publishing CAP1188 snapshots to other processes through
+shared memory, for Linux hosts using Blinka.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+One process owns the bus and runs `serve`, or ``python3 -m
+adafruit_cap1188.service``. Each snapshot is written into a ring of fixed
+size slots in a ``multiprocessing.shared_memory`` block. Any number of
+processes read it with `CAP1188_Subscriber`, without locks: every slot is
+guarded by a sequence counter that is odd while the slot is being written,
+and a reader retries if the counter changed under it (a seqlock). The
+block records the process ID of its publisher; a second publisher of the
+same name is refused while that process is alive.
+
+Requires Python 3.8 or later; not available on CircuitPython.
+
+"""
+
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from adafruit_cap1188.threaded import CAP1188_Frame
+
+try:
+    from typing import Callable, Optional
+
+    from adafruit_cap1188.cap1188 import CAP1188, CAP1188_Snapshot
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_MAGIC = b"C188"
+# magic, slot count, sequence number of the newest frame, publisher process ID
+_HEADER_FORMAT = "<4sIQI4x"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+# seqlock counter, frame sequence, timestamp, status, noise, general status, deltas
+_SLOT_FORMAT = "<I4xQdBBB5x8b"
+_SLOT_SIZE = struct.calcsize(_SLOT_FORMAT)
+_DEFAULT_NAME = "cap1188"
+# reads of a slot before giving up on a publisher that stopped mid-write
+_READ_ATTEMPTS = 1000
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block. Unless this process publishes it, the block is
+    not left registered with the resource tracker, which would unlink it
+    when this process exits."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python before 3.13 registers every block it opens
+        pass
+    memory = shared_memory.SharedMemory(name=name)
+    if os.name == "posix" and (
+        memory.size < _HEADER_SIZE
+        or struct.unpack_from(_HEADER_FORMAT, memory.buf)[3] != os.getpid()
+    ):
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+def _alive(pid: int) -> bool:
+    if not pid:
+        return False
+    if os.name != "posix" or pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class CAP1188_Publisher:
+    """Owner side of the shared memory snapshot ring. A block of the same
+    name left behind by a publisher that has exited without closing, e.g.
+    after a crash, is taken over, so subscribers still attached to it keep
+    receiving frames. Raises `FileExistsError` if its publisher is running.
+
+    :param str name: Name of the shared memory block.
+    :param int slots: Number of frames kept in the ring.
+    """
+
+    def __init__(self, name: str = _DEFAULT_NAME, slots: int = 16) -> None:
+        size = _HEADER_SIZE + slots * _SLOT_SIZE
+        try:
+            memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            memory = _attach(name)
+            if memory.size >= _HEADER_SIZE:
+                magic, _, _, owner = struct.unpack_from(_HEADER_FORMAT, memory.buf)
+                if magic == _MAGIC and _alive(owner):
+                    memory.close()
+                    raise FileExistsError(
+                        f"Snapshot ring {name!r} is published by process {owner}."
+                    ) from None
+            memory.close()
+            # the block is ours now, let the resource tracker clean it up
+            memory = shared_memory.SharedMemory(name=name)
+            if memory.size < size:
+                memory.close()
+                memory.unlink()
+                memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._memory = memory
+        self._slots = slots
+        self._sequence = 0
+        buf = memory.buf
+        magic, old_slots, sequence, _ = struct.unpack_from(_HEADER_FORMAT, buf)
+        if magic == _MAGIC and old_slots == slots:
+            # continue the old ring, dropping a frame left half written
+            self._sequence = sequence
+            for offset in range(_HEADER_SIZE, size, _SLOT_SIZE):
+                (counter,) = struct.unpack_from("<I", buf, offset)
+                if counter & 1:
+                    struct.pack_into("<I4xQ", buf, offset, counter + 1 & 0xFFFFFFFF, 0)
+            struct.pack_into(_HEADER_FORMAT, buf, 0, _MAGIC, slots, sequence, os.getpid())
+        else:
+            buf[:size] = bytes(size)
+            struct.pack_into(_HEADER_FORMAT, buf, 0, _MAGIC, slots, 0, os.getpid())
+
+    def publish(self, snapshot: "CAP1188_Snapshot", timestamp: Optional[float] = None) -> int:
+        """Write a snapshot into the next slot and return its sequence number."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        buf = self._memory.buf
+        self._sequence += 1
+        offset = _HEADER_SIZE + self._sequence % self._slots * _SLOT_SIZE
+        (counter,) = struct.unpack_from("<I", buf, offset)
+        # odd while writing
+        struct.pack_into("<I", buf, offset, counter + 1 & 0xFFFFFFFF)
+        struct.pack_into(
+            _SLOT_FORMAT,
+            buf,
+            offset,
+            counter + 1 & 0xFFFFFFFF,
+            self._sequence,
+            timestamp,
+            snapshot.status,
+            snapshot.noise,
+            snapshot.general_status,
+            *snapshot.deltas,
+        )
+        struct.pack_into("<I", buf, offset, counter + 2 & 0xFFFFFFFF)
+        struct.pack_into("<Q", buf, 8, self._sequence)
+        return self._sequence
+
+    def close(self) -> None:
+        """Release the shared memory block and remove it if this process
+        still owns it."""
+        memory = self._memory
+        _, _, _, owner = struct.unpack_from(_HEADER_FORMAT, memory.buf)
+        memory.close()
+        if owner == os.getpid():
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class CAP1188_Subscriber:
+    """Reader side of the shared memory snapshot ring.
+
+    :param str name: Name of the shared memory block.
+    """
+
+    def __init__(self, name: str = _DEFAULT_NAME) -> None:
+        self._memory = _attach(name)
+        magic, self._slots, _, _ = struct.unpack_from(_HEADER_FORMAT, self._memory.buf)
+        if magic != _MAGIC:
+            self._memory.close()
+            raise ValueError("Not a CAP1188 snapshot ring.")
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the newest frame, 0 before the first."""
+        return struct.unpack_from("<Q", self._memory.buf, 8)[0]
+
+    def read(self, sequence: Optional[int] = None) -> Optional[CAP1188_Frame]:
+        """Return the frame with the given sequence number, by default the
+        newest one. Returns `None` if there is no such frame yet, it has
+        already been overwritten, or the publisher stopped while writing it."""
+        if sequence is None:
+            sequence = self.sequence
+        if not sequence:
+            return None
+        buf = self._memory.buf
+        offset = _HEADER_SIZE + sequence % self._slots * _SLOT_SIZE
+        for _ in range(_READ_ATTEMPTS):
+            values = struct.unpack_from(_SLOT_FORMAT, buf, offset)
+            (counter,) = struct.unpack_from("<I", buf, offset)
+            if not values[0] & 1 and values[0] == counter:
+                break
+        else:
+            return None
+        if values[1] != sequence:
+            return None
+        return CAP1188_Frame(values[1], values[2], values[3], values[4], values[5], values[6:])
+
+    def wait(self, after: int, timeout: Optional[float] = None) -> Optional[CAP1188_Frame]:
+        """Poll until a frame newer than sequence number after is published
+        and return the newest frame, or `None` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.sequence <= after:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.001)
+        return self.read()
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self._memory.close()
+
+
+def serve(
+    cap1188: "CAP1188",
+    name: str = _DEFAULT_NAME,
+    slots: int = 16,
+    interval: Optional[float] = None,
+    running: Optional[Callable[[], bool]] = None,
+) -> None:
+    """Publish a snapshot every interval seconds, by default the sensor cycle
+    time, until running() returns `False` or the process is interrupted."""
+    if interval is None:
+        interval = cap1188.cycle_seconds
+    publisher = CAP1188_Publisher(name, slots)
+    try:
+        while running is None or running():
+            publisher.publish(cap1188.snapshot())
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+
+
+def main() -> None:
+    """Command line entry point serving a CAP1188 on the default I2C bus."""
+    import argparse  # noqa: PLC0415
+
+    import board  # noqa: PLC0415
+
+    from adafruit_cap1188.i2c import CAP1188_I2C  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(description="Publish CAP1188 snapshots to shared memory.")
+    parser.add_argument("--address", type=lambda value: int(value, 0), default=0x29)
+    parser.add_argument("--name", default=_DEFAULT_NAME)
+    parser.add_argument("--slots", type=int, default=16)
+    args = parser.parse_args()
+    serve(CAP1188_I2C(board.I2C(), args.address), args.name, args.slots)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,502 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.settings`
+====================================================
+
+Configuration registers of the CAP1188: sensing settings, touch thresholds,
+the chip's repeat, multi touch and standby features, and the shadow cache
+and batches through which they are accessed.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+`CAP1188_Settings` is mixed into `adafruit_cap1188.cap1188.CAP1188`,
+keeping `adafruit_cap1188.core.CAP1188_Core` down to register I/O, touch and
+snapshot reads. A driver that only needs those can extend the core alone
+and skip importing this module.
+
+"""
+
+from micropython import const
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_MAIN_CONTROL = const(0x00)
+_CAP1188_SENSITIVTY = const(0x1F)
+_CAP1188_CONFIG = const(0x20)
+_CAP1188_INPUT_CFG = const(0x22)
+_CAP1188_INPUT_CFG_2 = const(0x23)
+_CAP1188_AVERAGING = const(0x24)
+_CAP1188_REPEAT_ENABLE = const(0x28)
+_CAP1188_MULTI_TOUCH_CFG = const(0x2A)
+_CAP1188_THESHOLD_1 = const(0x30)
+_CAP1188_STANDBY_CHANNEL = const(0x40)
+
+# Contiguous runs of configuration registers held in the shadow cache.
+# Calibration Activate (0x26) clears itself and is never cached.
+_CONFIG_RUNS = ((0x1F, 6), (0x27, 9), (0x30, 8), (0x40, 4), (0x72, 1))
+# unchanged registers a block write may span to join two changed ones
+_MAX_GAP = const(2)
+
+_SENSITIVITY = (128, 64, 32, 16, 8, 4, 2, 1)
+_AVG = (1, 2, 4, 8, 16, 32, 64, 128)
+_SAMP_TIME = ("320us", "640us", "1.28ms", "2.56ms")
+_CYCLE_TIME = ("35ms", "70ms", "105ms", "140ms")
+_CYCLE_MS = (35, 70, 105, 140)
+_REPEAT_STEP_MS = const(35)
+_MAX_DURATION = (
+    560,
+    840,
+    1120,
+    1400,
+    1680,
+    2240,
+    2800,
+    3360,
+    3920,
+    4480,
+    5600,
+    6720,
+    7840,
+    8960,
+    10080,
+    11200,
+)
+
+
+def _ms_to_steps(value: int, step: int) -> int:
+    """Return the 4 bit register encoding of a time in multiples of step."""
+    if value % step or not step <= value <= 16 * step:
+        raise ValueError(f"Time must be a multiple of {step} from {step} to {16 * step} ms.")
+    return value // step - 1
+
+
+class CAP1188_Settings:
+    """Configuration API of the CAP1188 driver, mixed in ahead of
+    `CAP1188_Core`."""
+
+    _shadow = None
+    _shadow_state = None
+    _batch = None
+
+    @property
+    def sensitivity(self) -> int:
+        """The sensitvity of touch detections. Range is 1 (least) to 128 (most)."""
+        return _SENSITIVITY[self._read_config(_CAP1188_SENSITIVTY) >> 4 & 0x07]
+
+    @sensitivity.setter
+    def sensitivity(self, value: int) -> None:
+        if value not in _SENSITIVITY:
+            raise ValueError(f"Sensitivty must be one of: {_SENSITIVITY}")
+        value = _SENSITIVITY.index(value) << 4
+        new_setting = self._read_config(_CAP1188_SENSITIVTY) & 0x8F | value
+        self._write_config(_CAP1188_SENSITIVTY, new_setting)
+
+    @property
+    def averaging(self) -> int:
+        """Samples that are taken for all active channels during the
+        sensor cycle. All samples are taken consecutively on
+        the same channel before the next channel is sampled
+        and the result is averaged over the number of samples measured
+        before  updating the measured results
+
+        if CS1, CS2, and CS3 are sampled during the sensor cycle,
+        and the AVG[2:0] bits are set to take 4 samples per channel,
+        then the full sensor cycle will be:
+        CS1, CS1, CS1, CS1, CS2, CS2, CS2, CS2, CS3, CS3, CS3, CS3.
+        """
+
+        register = self._read_config(_CAP1188_AVERAGING)
+
+        return _AVG[register >> 4 & 0x07]
+
+    @averaging.setter
+    def averaging(self, value: int) -> None:
+        if value not in _AVG:
+            raise ValueError(f"Avg must be one of: {_AVG}")
+        register = self._read_config(_CAP1188_AVERAGING)
+        register &= 0x8F
+        avg = _AVG.index(value)
+        avg_value = register | avg << 4
+        self._write_config(_CAP1188_AVERAGING, avg_value)
+
+    @property
+    def sample(self) -> str:
+        """Determines the overall cycle time for all  measured  channels
+        during normal operation. All measured channels are sampled at the
+        beginning of the cycle time. If additional time is remaining, then
+        the  device is placed into a lower power state for the remaining
+        duration of the cycle."""
+
+        register = self._read_config(_CAP1188_AVERAGING)
+
+        return _SAMP_TIME[register >> 2 & 0x03]
+
+    @sample.setter
+    def sample(self, value: str) -> None:
+        if value not in _SAMP_TIME:
+            raise ValueError(f"Sample Time must be one of: {_SAMP_TIME}")
+        register = self._read_config(_CAP1188_AVERAGING)
+        register &= 0xF3
+        samp_time = _SAMP_TIME.index(value)
+        sample_value = register | samp_time << 2
+        self._write_config(_CAP1188_AVERAGING, sample_value)
+
+    @property
+    def cycle(self) -> str:
+        """The programmed cycle time is only maintained if
+        the total averaging time for all samples is less
+        than the programmed cycle. The AVG[2:0] bits will
+        take priority so that if more samples are required
+        than  would normally be allowed during the cycle
+        time, the cycle time will be extended as necessary
+        to accommodate the number of samples to be measured.
+        """
+
+        register = self._read_config(_CAP1188_AVERAGING)
+
+        return _CYCLE_TIME[register & 0x03]
+
+    @cycle.setter
+    def cycle(self, value: str) -> None:
+        if value not in _CYCLE_TIME:
+            raise ValueError(f"Cycle Time must be one of: {_CYCLE_TIME}")
+        register = self._read_config(_CAP1188_AVERAGING)
+        register &= 0xFC
+        cycle_time = _CYCLE_TIME.index(value)
+        cycle_value = register | cycle_time
+        self._write_config(_CAP1188_AVERAGING, cycle_value)
+
+    @property
+    def cycle_seconds(self) -> float:
+        """The programmed `cycle` time in seconds, the interval at which the
+        device produces new readings."""
+        return _CYCLE_MS[self._read_config(_CAP1188_AVERAGING) & 0x03] / 1000
+
+    @property
+    def thresholds(self) -> Tuple[int, int, int, int, int, int, int, int]:
+        """Touch threshold value for all channels."""
+        return self.threshold_values()
+
+    @thresholds.setter
+    def thresholds(self, value: int) -> None:
+        value = int(value)
+        if not 0 <= value <= 127:
+            raise ValueError("Threshold value must be in range 0 to 127.")
+        self._write_config_block(_CAP1188_THESHOLD_1, bytearray((value,) * 8))
+
+    def threshold_values(
+        self, result: Optional[bytearray] = None
+    ) -> Union[Tuple[int, int, int, int, int, int, int, int], bytearray]:
+        """Return tuple of touch threshold values for all channels. If result,
+        a caller owned bytearray of 8 bytes, is given it is filled instead and
+        returned, without allocating."""
+        if result is not None:
+            return self.thresholds_into(result)
+        return tuple(self.thresholds_into(bytearray(8)))
+
+    def thresholds_into(self, buf: bytearray) -> bytearray:
+        """Fill the caller owned bytearray buf with the touch threshold values
+        of all channels, with one block read or from the register cache, and
+        return it."""
+        return self._read_config_block_into(_CAP1188_THESHOLD_1, buf)
+
+    @property
+    def repeat_rate(self) -> int:
+        """Interval in milliseconds, 35 to 560 in steps of 35, at which the
+        device repeats the interrupt for a held touch on `repeat_pins`."""
+        return ((self._read_config(_CAP1188_INPUT_CFG) & 0x0F) + 1) * _REPEAT_STEP_MS
+
+    @repeat_rate.setter
+    def repeat_rate(self, value: int) -> None:
+        self._write_config_bits(_CAP1188_INPUT_CFG, 0x0F, _ms_to_steps(value, _REPEAT_STEP_MS))
+
+    @property
+    def hold_time(self) -> int:
+        """Time in milliseconds, 35 to 560 in steps of 35, a touch must be held
+        before the device starts repeating the interrupt."""
+        return ((self._read_config(_CAP1188_INPUT_CFG_2) & 0x0F) + 1) * _REPEAT_STEP_MS
+
+    @hold_time.setter
+    def hold_time(self, value: int) -> None:
+        self._write_config_bits(_CAP1188_INPUT_CFG_2, 0x0F, _ms_to_steps(value, _REPEAT_STEP_MS))
+
+    @property
+    def repeat_pins(self) -> int:
+        """8 bit mask of the pins that repeat the interrupt while held."""
+        return self._read_config(_CAP1188_REPEAT_ENABLE)
+
+    @repeat_pins.setter
+    def repeat_pins(self, mask: int) -> None:
+        self._write_config(_CAP1188_REPEAT_ENABLE, mask & 0xFF)
+
+    @property
+    def max_duration(self) -> int:
+        """Time in milliseconds after which a touch is recalibrated away when
+        `max_duration_recalibration` is on."""
+        return _MAX_DURATION[self._read_config(_CAP1188_INPUT_CFG) >> 4]
+
+    @max_duration.setter
+    def max_duration(self, value: int) -> None:
+        if value not in _MAX_DURATION:
+            raise ValueError(f"Max duration must be one of: {_MAX_DURATION}")
+        self._write_config_bits(_CAP1188_INPUT_CFG, 0xF0, _MAX_DURATION.index(value) << 4)
+
+    @property
+    def max_duration_recalibration(self) -> bool:
+        """Whether a touch held longer than `max_duration` is recalibrated."""
+        return bool(self._read_config(_CAP1188_CONFIG) & 0x08)
+
+    @max_duration_recalibration.setter
+    def max_duration_recalibration(self, value: bool) -> None:
+        self._write_config_bits(_CAP1188_CONFIG, 0x08, 0x08 if value else 0x00)
+
+    @property
+    def multi_touch_blocking(self) -> bool:
+        """Whether touches beyond `multi_touch_limit` simultaneous pins are
+        ignored by the device."""
+        return bool(self._read_config(_CAP1188_MULTI_TOUCH_CFG) & 0x80)
+
+    @multi_touch_blocking.setter
+    def multi_touch_blocking(self, value: bool) -> None:
+        self._write_config_bits(_CAP1188_MULTI_TOUCH_CFG, 0x80, 0x80 if value else 0x00)
+
+    @property
+    def multi_touch_limit(self) -> int:
+        """Number of simultaneous touches, 1 to 4, allowed while
+        `multi_touch_blocking` is on."""
+        return (self._read_config(_CAP1188_MULTI_TOUCH_CFG) >> 2 & 0x03) + 1
+
+    @multi_touch_limit.setter
+    def multi_touch_limit(self, value: int) -> None:
+        if not 1 <= value <= 4:
+            raise ValueError("Multi touch limit must be in range 1 to 4.")
+        self._write_config_bits(_CAP1188_MULTI_TOUCH_CFG, 0x0C, value - 1 << 2)
+
+    @property
+    def standby(self) -> bool:
+        """Whether the device is in standby, sensing only `standby_pins`."""
+        return bool(self._read_register(_CAP1188_MAIN_CONTROL) & 0x20)
+
+    @standby.setter
+    def standby(self, value: bool) -> None:
+        # never write back a set INT bit, which would latch an interrupt
+        current = self._read_register(_CAP1188_MAIN_CONTROL) & 0xDE
+        self._write_register(_CAP1188_MAIN_CONTROL, current | (0x20 if value else 0x00))
+
+    @property
+    def standby_pins(self) -> int:
+        """8 bit mask of the pins sensed while in `standby`."""
+        return self._read_config(_CAP1188_STANDBY_CHANNEL)
+
+    @standby_pins.setter
+    def standby_pins(self, mask: int) -> None:
+        self._write_config(_CAP1188_STANDBY_CHANNEL, mask & 0xFF)
+
+    def configure_standby(
+        self,
+        pins: int,
+        averaging: int = 8,
+        sample: str = "1.28ms",
+        cycle: str = "70ms",
+        sensitivity: int = 32,
+        threshold: int = 64,
+    ) -> None:
+        """Set up standby sensing with a single block write of the standby
+        channel, configuration, sensitivity and threshold registers. The
+        arguments take the same values as `averaging`, `sample`, `cycle`,
+        `sensitivity` and `thresholds`; the defaults are the power on values.
+        Set `standby` to enter standby."""
+        if averaging not in _AVG:
+            raise ValueError(f"Avg must be one of: {_AVG}")
+        if sample not in _SAMP_TIME:
+            raise ValueError(f"Sample Time must be one of: {_SAMP_TIME}")
+        if cycle not in _CYCLE_TIME:
+            raise ValueError(f"Cycle Time must be one of: {_CYCLE_TIME}")
+        if sensitivity not in _SENSITIVITY:
+            raise ValueError(f"Sensitivty must be one of: {_SENSITIVITY}")
+        if not 0 <= threshold <= 127:
+            raise ValueError("Threshold value must be in range 0 to 127.")
+        standby_cfg = (
+            _AVG.index(averaging) << 4 | _SAMP_TIME.index(sample) << 2 | _CYCLE_TIME.index(cycle)
+        )
+        self._write_config_block(
+            _CAP1188_STANDBY_CHANNEL,
+            bytes((pins & 0xFF, standby_cfg, _SENSITIVITY.index(sensitivity), threshold)),
+        )
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether configuration registers are kept in a shadow cache. When
+        enabled, configuration getters are served from the cache and setters
+        write through to the device. Call `invalidate` if the device may have
+        been changed behind the driver's back (e.g. after a reset)."""
+        return self._shadow is not None
+
+    @cache_enabled.setter
+    def cache_enabled(self, value: bool) -> None:
+        if not value:
+            self._shadow = None
+            self._shadow_state = None
+        elif self._shadow is None:
+            self._shadow = bytearray(256)
+            # 0: not cached, 1: cached but stale, 2: cached and valid
+            self._shadow_state = bytearray(256)
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Mark every cached configuration register as stale."""
+        if self._shadow is None:
+            return
+        state = self._shadow_state
+        for start, length in _CONFIG_RUNS:
+            for address in range(start, start + length):
+                state[address] = 1
+
+    def sync(self) -> None:
+        """Refresh the whole configuration cache from the device using one
+        block read per contiguous register run."""
+        if self._shadow is None:
+            raise RuntimeError("Register cache is not enabled.")
+        for start, length in _CONFIG_RUNS:
+            data = self._read_block(start, length)
+            self._shadow[start : start + length] = data
+            for address in range(start, start + length):
+                self._shadow_state[address] = 2
+
+    def _read_config(self, address: int) -> int:
+        """Return 8 bit value of configuration register, from cache if possible."""
+        batch = self._batch
+        if batch is not None and batch.state[address]:
+            return batch.values[address]
+        state = self._shadow_state
+        if state is None or not state[address]:
+            value = self._read_register(address)
+        else:
+            if state[address] == 1:
+                self._shadow[address] = self._read_register(address)
+                state[address] = 2
+            value = self._shadow[address]
+        if batch is not None:
+            batch.values[address] = value
+            batch.state[address] = 1
+        return value
+
+    def _write_config(self, address: int, value: int) -> None:
+        """Write 8 bit value to configuration register, updating the cache."""
+        if self._batch is not None:
+            self._batch.write(address, value)
+            return
+        self._write_register(address, value)
+        state = self._shadow_state
+        if state is not None and state[address]:
+            self._shadow[address] = value
+            state[address] = 2
+
+    def _write_config_bits(self, address: int, mask: int, bits: int) -> None:
+        """Replace the bits in mask of a configuration register with bits."""
+        self._write_config(address, self._read_config(address) & ~mask | bits)
+
+    def _read_config_block_into(self, start: int, buf: bytearray) -> bytearray:
+        """Fill buf with configuration values from start address, from cache if
+        possible, and return it."""
+        length = len(buf)
+        batch = self._batch
+        if batch is not None and batch.read_block_into(start, buf):
+            return buf
+        state = self._shadow_state
+        if state is not None:
+            for address in range(start, start + length):
+                if state[address] != 2:
+                    break
+            else:
+                for i in range(length):
+                    buf[i] = self._shadow[start + i]
+                if batch is not None:
+                    batch.merge(start, buf)
+                return buf
+        self._read_block_into(start, buf)
+        if state is not None:
+            for i in range(length):
+                if state[start + i]:
+                    self._shadow[start + i] = buf[i]
+                    state[start + i] = 2
+        if batch is not None:
+            batch.merge(start, buf)
+        return buf
+
+    def _write_config_block(self, start: int, data: Union[bytearray, bytes]) -> None:
+        """Write out configuration data beginning at start address, updating the cache."""
+        if self._batch is not None:
+            for i, value in enumerate(data):
+                self._batch.write(start + i, value)
+            return
+        self._write_block(start, data)
+        state = self._shadow_state
+        if state is not None:
+            for i, value in enumerate(data):
+                if state[start + i]:
+                    self._shadow[start + i] = value
+                    state[start + i] = 2
+
+    def _write_config_changes(
+        self, start: int, data: Union[bytearray, memoryview], marks: bytearray
+    ) -> int:
+        """Write the values in data, beginning at start address, that are
+        marked 2 in marks with as few writes as possible, and mark them 1.
+        Registers marked 1 hold their data value already and are written
+        too when that joins two changes into one block; those marked 0 are
+        never written. Returns the number of writes."""
+        view = memoryview(data)
+        length = len(data)
+        writes = 0
+        i = 0
+        while i < length:
+            if marks[i] != 2:
+                i += 1
+                continue
+            first = last = i
+            i += 1
+            # extend across changed registers and short gaps of known ones
+            while i < length and marks[i] and i - last <= _MAX_GAP + 1:
+                if marks[i] == 2:
+                    last = i
+                i += 1
+            i = last + 1
+            if first == last:
+                self._write_config(start + first, data[first])
+            else:
+                self._write_config_block(start + first, view[first:i])
+            writes += 1
+            for changed in range(first, i):
+                marks[changed] = 1
+        return writes
+
+    def batch(self) -> "CAP1188_Batch":
+        """Return a context manager that queues configuration changes and
+        writes them when the block exits. Settings sharing a register are
+        merged and adjacent registers are written in one block::
+
+            with cap.batch():
+                cap.averaging = 4
+                cap.sample = "640us"
+                cap.cycle = "70ms"  # one read and one write of 0x24
+
+        Queued writes are dropped if the block raises. Nested blocks join the
+        outermost one."""
+        from adafruit_cap1188.batch import CAP1188_Batch  # noqa: PLC0415
+
+        if self._batch is not None:
+            return self._batch
+        return CAP1188_Batch(self)
@@ -0,0 +1,362 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.simulator`
+====================================================
+
+Register level CAP1188 simulator for exercising the driver without hardware.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+`SimulatedI2C` and `SimulatedSPI` stand in for ``busio.I2C`` and
+``busio.SPI``, so the unmodified `CAP1188_I2C` and `CAP1188_SPI` drivers,
+including their Bus Device wrappers, can talk to a `CAP1188_Simulator`::
+
+    sim = CAP1188_Simulator()
+    cap = CAP1188_I2C(SimulatedI2C(sim))
+    sim.touch(3)
+    print(cap[3].value)
+
+Sensing is modelled one cycle at a time: call `CAP1188_Simulator.cycle`
+after changing the simulated signals, or let `touch` and `release` do it.
+
+"""
+
+from micropython import const
+
+try:
+    from typing import Optional, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_DEFAULT_ADDRESS = const(0x29)
+_CAP1188_MAIN_CONTROL = const(0x00)
+_CAP1188_GENERAL_STATUS = const(0x02)
+_CAP1188_INPUT_STATUS = const(0x03)
+_CAP1188_NOISE_FLAGS = const(0x0A)
+_CAP1188_DELTA_COUNT_1 = const(0x10)
+_CAP1188_CAL_ACTIVATE = const(0x26)
+_CAP1188_THESHOLD_1 = const(0x30)
+_CAP1188_SPI_SET_ADDR = const(0x7D)
+_CAP1188_SPI_WRITE_DATA = const(0x7E)
+_CAP1188_SPI_READ_DATA = const(0x7F)
+
+# power on values of the registers that have non zero defaults
+_RESET_VALUES = (
+    (0x1F, 0x2F),
+    (0x20, 0x20),
+    (0x21, 0xFF),
+    (0x22, 0xA4),
+    (0x23, 0x07),
+    (0x24, 0x39),
+    (0x27, 0xFF),
+    (0x28, 0xFF),
+    (0x2A, 0x80),
+    (0x2D, 0xFF),
+    (0x2F, 0x8A),
+    (0x30, 0x40),
+    (0x31, 0x40),
+    (0x32, 0x40),
+    (0x33, 0x40),
+    (0x34, 0x40),
+    (0x35, 0x40),
+    (0x36, 0x40),
+    (0x37, 0x40),
+    (0x38, 0x01),
+    (0x41, 0x39),
+    (0x42, 0x02),
+    (0x43, 0x40),
+    (0x44, 0x40),
+    (0xFD, 0x50),
+    (0xFE, 0x5D),
+    (0xFF, 0x83),
+)
+# registers only the device itself updates
+_READ_ONLY = (0x02, 0x03, 0x04, 0x0A, 0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17)
+
+
+class CAP1188_Simulator:
+    """A simulated CAP1188 register file with touch, interrupt and calibration
+    behaviour. Bus traffic reaching it is counted in `transactions`,
+    `bytes_written` and `bytes_read`."""
+
+    def __init__(self) -> None:
+        self.registers = bytearray(256)
+        """The 256 byte register file."""
+        for address, value in _RESET_VALUES:
+            self.registers[address] = value
+        self.signal = [0] * 8
+        """Simulated raw count of pins 1 to 8."""
+        self.baseline = [0] * 8
+        """Calibrated base count of pins 1 to 8."""
+        self.noise = 0
+        """Noise flags reported for the next cycle, one bit per pin."""
+        self._touched = 0
+        self._pointer = 0
+        self._spi_state = None
+        self._spi_out = 0
+        self.transactions = 0
+        """Number of bus transactions that reached the device."""
+        self.bytes_written = 0
+        """Number of bytes written to the device."""
+        self.bytes_read = 0
+        """Number of bytes read from the device."""
+        self.faults = 0
+        """Number of upcoming bus transactions that fail with `OSError`, as if
+        the device did not acknowledge."""
+
+    def reset_counters(self) -> None:
+        """Zero the bus traffic counters."""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def touch(self, pin: int, counts: int = 100) -> None:
+        """Raise the signal of pin (1-8) by counts above its baseline and run a cycle."""
+        self.signal[pin - 1] = self.baseline[pin - 1] + counts
+        self.cycle()
+
+    def release(self, pin: int) -> None:
+        """Return the signal of pin (1-8) to its baseline and run a cycle."""
+        self.signal[pin - 1] = self.baseline[pin - 1]
+        self.cycle()
+
+    def cycle(self) -> None:
+        """Run one sensing cycle: calibrate requested pins, update the delta
+        counts and input status, and raise the INT bit on any change."""
+        registers = self.registers
+        calibrate = registers[_CAP1188_CAL_ACTIVATE]
+        touched = 0
+        for i in range(8):
+            if calibrate >> i & 1:
+                self.baseline[i] = self.signal[i]
+            delta = max(-128, min(127, self.signal[i] - self.baseline[i]))
+            registers[_CAP1188_DELTA_COUNT_1 + i] = delta & 0xFF
+            if delta >= registers[_CAP1188_THESHOLD_1 + i]:
+                touched |= 1 << i
+        registers[_CAP1188_CAL_ACTIVATE] = 0
+        registers[_CAP1188_NOISE_FLAGS] = self.noise
+        if touched != self._touched:
+            registers[_CAP1188_MAIN_CONTROL] |= 0x01
+        self._touched = touched
+        registers[_CAP1188_INPUT_STATUS] |= touched
+        # TOUCH bit
+        registers[_CAP1188_GENERAL_STATUS] = 0x02 if touched else 0x00
+
+    def read(self, address: int) -> int:
+        """Return the value of a register as the bus sees it."""
+        return self.registers[address]
+
+    def write(self, address: int, value: int) -> None:
+        """Write a register as the bus would."""
+        if address in _READ_ONLY:
+            return
+        self.registers[address] = value
+        if address == _CAP1188_MAIN_CONTROL and not value & 0x01:
+            # clearing INT drops latched touches that have since been released
+            self.registers[_CAP1188_INPUT_STATUS] = self._touched
+
+    def _fault(self) -> None:
+        if self.faults:
+            self.faults -= 1
+            raise OSError(121, "Remote I/O error")
+
+    def _next_pointer(self) -> int:
+        address = self._pointer
+        self._pointer = address + 1 & 0xFF
+        return address
+
+    def _i2c_write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        self._fault()
+        self.transactions += 1
+        self.bytes_written += len(data)
+        if not data:
+            return
+        self._pointer = data[0]
+        for value in data[1:]:
+            self.write(self._next_pointer(), value)
+
+    def _i2c_read(self, buf: Union[bytearray, memoryview]) -> None:
+        self._fault()
+        self.transactions += 1
+        self.bytes_read += len(buf)
+        for i in range(len(buf)):
+            buf[i] = self.read(self._next_pointer())
+
+    def _spi_transfer(self, value: int) -> int:
+        result = self._spi_out
+        self._spi_out = 0
+        if self._spi_state == _CAP1188_SPI_SET_ADDR:
+            self._pointer = value
+            self._spi_state = None
+        elif self._spi_state == _CAP1188_SPI_WRITE_DATA:
+            self.write(self._next_pointer(), value)
+            self._spi_state = None
+        elif value in {_CAP1188_SPI_SET_ADDR, _CAP1188_SPI_WRITE_DATA}:
+            self._spi_state = value
+        elif value == _CAP1188_SPI_READ_DATA:
+            self._spi_out = self.read(self._next_pointer())
+        return result
+
+
+class SimulatedI2C:
+    """Stand in for ``busio.I2C`` with simulated CAP1188s attached.
+
+    :param CAP1188_Simulator simulator: Optional device at address.
+    :param int address: The address of simulator.
+    """
+
+    def __init__(
+        self,
+        simulator: Optional[CAP1188_Simulator] = None,
+        address: int = _CAP1188_DEFAULT_ADDRESS,
+    ) -> None:
+        self.devices = {}
+        """Attached simulators by I2C address."""
+        if simulator is not None:
+            self.devices[address] = simulator
+        self._locked = False
+
+    def try_lock(self) -> bool:
+        """Lock the bus, returning whether it was free."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus."""
+        self._locked = False
+
+    def scan(self) -> list:
+        """Addresses of the attached simulators."""
+        return sorted(self.devices)
+
+    def _device(self, address: int) -> CAP1188_Simulator:
+        if address not in self.devices:
+            raise OSError(19, "No such device")
+        return self.devices[address]
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write buffer[start:end] to the device at address."""
+        self._device(address)._i2c_write(memoryview(buffer)[start:end])
+
+    def readfrom_into(
+        self, address: int, buffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Read from the device at address into buffer[start:end]."""
+        self._device(address)._i2c_read(memoryview(buffer)[start:end])
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write then read with a repeated start, counted as one transaction."""
+        device = self._device(address)
+        device._i2c_write(memoryview(buffer_out)[out_start:out_end])
+        device._i2c_read(memoryview(buffer_in)[in_start:in_end])
+        device.transactions -= 1
+
+
+class SimulatedPin:
+    """Stand in for a ``digitalio.DigitalInOut`` chip select or ALERT pin."""
+
+    def __init__(self, value: bool = True) -> None:
+        self.value = value
+        """The pin level."""
+
+    def switch_to_output(self, value: bool = False, **kwargs) -> None:
+        """Set the pin level."""
+        self.value = value
+
+    def switch_to_input(self, **kwargs) -> None:
+        """Accepted and ignored."""
+
+
+class SimulatedSPI:
+    """Stand in for ``busio.SPI`` with a simulated CAP1188 attached.
+
+    :param CAP1188_Simulator simulator: The attached device.
+    """
+
+    def __init__(self, simulator: CAP1188_Simulator) -> None:
+        self.simulator = simulator
+        """The attached simulator."""
+        self._locked = False
+
+    def try_lock(self) -> bool:
+        """Lock the bus, returning whether it was free."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus."""
+        self._locked = False
+
+    def configure(
+        self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ) -> None:
+        """Accepted and ignored. Named explicitly so that configuring the bus,
+        which the Bus Device wrapper does on every transaction, allocates no
+        keyword dictionary."""
+
+    def write(self, buffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Clock out buffer[start:end]."""
+        data = memoryview(buffer)[start:end]
+        device = self.simulator
+        device._fault()
+        device.transactions += 1
+        device.bytes_written += len(data)
+        for value in data:
+            device._spi_transfer(value)
+
+    def readinto(
+        self, buffer, *, start: int = 0, end: Optional[int] = None, write_value: int = 0
+    ) -> None:
+        """Clock write_value out while reading into buffer[start:end]."""
+        data = memoryview(buffer)[start:end]
+        device = self.simulator
+        device._fault()
+        device.transactions += 1
+        device.bytes_read += len(data)
+        for i in range(len(data)):
+            data[i] = device._spi_transfer(write_value)
+
+    def write_readinto(
+        self,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Full duplex transfer of buffer_out[out_start:out_end] into
+        buffer_in[in_start:in_end]."""
+        data_out = bytes(memoryview(buffer_out)[out_start:out_end])
+        data_in = memoryview(buffer_in)[in_start:in_end]
+        device = self.simulator
+        device._fault()
+        device.transactions += 1
+        device.bytes_written += len(data_out)
+        device.bytes_read += len(data_in)
+        for i, value in enumerate(data_out):
+            data_in[i] = device._spi_transfer(value)
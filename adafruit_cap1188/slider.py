@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.slider`
+====================================================
+
+Slider and wheel position from the CAP1188 delta counts.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Each update reads the 8 Delta Count registers (0x10-0x17) in one burst and
+interpolates the touch position between the strongest pad and its two
+neighbours. All arithmetic is on small integers and the state is allocated
+up front, so an update does not allocate on CircuitPython. Call `update`
+once per sensing cycle, every `CAP1188_Slider.period` seconds::
+
+    slider = CAP1188_Slider(cap)
+    while True:
+        if slider.update():
+            print(slider.position, slider.velocity)
+        time.sleep(slider.period)
+
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from typing import Optional, Tuple
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_DELTA_COUNT_1 = const(0x10)
+
+
+class CAP1188_Slider:
+    """Linear slider or circular wheel made of several CAP1188 pads.
+
+    :param CAP1188 cap1188: The sensor the pads are connected to.
+    :param tuple pins: Pins (1-8) in order along the slider or around the wheel.
+    :param bool wheel: Whether the last pad is next to the first one.
+    :param int resolution: Position steps between two neighbouring pads.
+    :param int threshold: Minimum delta count of the strongest pad to report a
+        touch.
+    :param int smoothing: Position and velocity averaging weight as a power of
+        two; each update moves them 1/2**smoothing of the way to the new
+        value. 0 disables smoothing.
+    """
+
+    def __init__(
+        self,
+        cap1188: "CAP1188",
+        pins: Tuple[int, ...] = (1, 2, 3, 4, 5, 6, 7, 8),
+        wheel: bool = False,
+        resolution: int = 64,
+        threshold: int = 32,
+        smoothing: int = 2,
+    ) -> None:
+        if len(pins) < 2 or not all(1 <= pin <= 8 for pin in pins):
+            raise ValueError("At least two pins in range 1-8 are required.")
+        self._cap1188 = cap1188
+        self._index = bytes(pin - 1 for pin in pins)
+        self._count = len(pins)
+        self._buf = bytearray(8)
+        self._wheel = wheel
+        self._resolution = resolution
+        self._span = self._count * resolution if wheel else (self._count - 1) * resolution
+        self.threshold = threshold
+        """Minimum delta count of the strongest pad to report a touch."""
+        self._smoothing = smoothing
+        self._position = 0  # scaled by 2**smoothing
+        self._velocity = 0  # scaled by 2**smoothing
+        self._last_time = 0
+        self.touched = False
+        """Whether the slider was touched at the last update."""
+        self.raw_position = 0
+        """Unfiltered position of the last touch."""
+        self.period = cap1188.cycle_seconds
+        """Sensing cycle time in seconds, the useful update interval."""
+
+    @property
+    def span(self) -> int:
+        """Number of positions; `position` is from 0 up to, for a slider
+        including, this value."""
+        return self._span
+
+    @property
+    def position(self) -> Optional[int]:
+        """Filtered position of the current touch, or `None` if untouched."""
+        if not self.touched:
+            return None
+        return self._position >> self._smoothing
+
+    @property
+    def velocity(self) -> int:
+        """Filtered position change per second, 0 if untouched."""
+        if not self.touched:
+            return 0
+        return self._velocity >> self._smoothing
+
+    def _delta(self, i: int) -> int:
+        value = self._buf[self._index[i]]
+        # 8 bit 2's complement, negative deltas count as no signal
+        return 0 if value & 0x80 else value
+
+    def update(self, now: Optional[int] = None) -> bool:
+        """Read the delta counts and update the position. now is the time in
+        milliseconds, by default read from the monotonic clock. Returns
+        whether the slider is touched."""
+        self._cap1188._read_block_into(_CAP1188_DELTA_COUNT_1, self._buf)
+        count = self._count
+        peak = 0
+        peak_delta = self._delta(0)
+        for i in range(1, count):
+            delta = self._delta(i)
+            if delta > peak_delta:
+                peak = i
+                peak_delta = delta
+        # a zero peak is never a touch, even with threshold 0
+        if peak_delta < self.threshold or not peak_delta:
+            self.touched = False
+            return False
+        if self._wheel:
+            left = self._delta((peak - 1) % count)
+            right = self._delta((peak + 1) % count)
+        else:
+            left = self._delta(peak - 1) if peak > 0 else 0
+            right = self._delta(peak + 1) if peak < count - 1 else 0
+        resolution = self._resolution
+        raw = peak * resolution + (right - left) * resolution // (left + peak_delta + right)
+        if self._wheel:
+            raw %= self._span
+        else:
+            raw = max(0, min(self._span, raw))
+        if now is None:
+            now = time.monotonic_ns() // 1000000
+        shift = self._smoothing
+        if not self.touched:
+            self._position = raw << shift
+            self._velocity = 0
+        else:
+            self._position += self._step(self._position >> shift, raw)
+            if self._wheel:
+                self._position %= self._span << shift
+            elapsed = now - self._last_time
+            if elapsed > 0:
+                velocity = self._step(self.raw_position, raw) * 1000 // elapsed
+                self._velocity += velocity - (self._velocity >> shift)
+        self.raw_position = raw
+        self._last_time = now
+        self.touched = True
+        return True
+
+    def _step(self, start: int, end: int) -> int:
+        step = end - start
+        if self._wheel:
+            # shortest way around
+            half = self._span >> 1
+            step = (step + half) % self._span - half
+        return step
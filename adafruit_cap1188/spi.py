@@ -39,9 +39,10 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
 _CAP1188_SPI_SET_ADDR = const(0x7D)
 _CAP1188_SPI_WRITE_DATA = const(0x7E)
 _CAP1188_SPI_READ_DATA = const(0x7F)
+_CAP1188_SPI_STAGE_SIZE = const(64)
 
 try:
-    from typing import Union
+    from typing import Optional, Union
 
     from busio import SPI
     from digitalio import DigitalInOut
@@ -52,10 +53,17 @@ except ImportError:
 class CAP1188_SPI(CAP1188):
     """Driver for the CAP1188 connected over SPI."""
 
-    def __init__(self, spi: SPI, cs: DigitalInOut) -> None:
+    def __init__(
+        self,
+        spi: SPI,
+        cs: DigitalInOut,
+        warm_start: bool = False,
+        recalibrate: Optional[bool] = None,
+    ) -> None:
         self._spi = spi_device.SPIDevice(spi, cs)
         self._buf = bytearray(4)
-        super().__init__()
+        self._stage = bytearray(_CAP1188_SPI_STAGE_SIZE)
+        super().__init__(warm_start, recalibrate)
 
     def _read_register(self, address: int) -> int:
         """Return 8 bit value of register at address."""
@@ -77,22 +85,51 @@ class CAP1188_SPI(CAP1188):
 
     def _read_block(self, start: int, length: int) -> bytearray:
         """Return byte array of values from start address to length."""
-        self._buf[0] = _CAP1188_SPI_SET_ADDR
-        self._buf[1] = start
-        self._buf[2] = _CAP1188_SPI_READ_DATA
-        result = bytearray((_CAP1188_SPI_READ_DATA,) * length)
-        with self._spi as spi:
-            spi.write(self._buf, end=3)
-            spi.write_readinto(result, result)
+        result = bytearray(length)
+        self._read_block_into(start, result)
         return result
 
+    def _read_block_into(self, start: int, buf: bytearray) -> None:
+        """Fill buf with values beginning at start address."""
+        # SET_ADDR, start, then one READ_DATA per byte in a single transfer;
+        # the value of each address is clocked out on the following byte
+        stage = self._stage
+        chunk = len(stage) - 3
+        length = len(buf)
+        offset = 0
+        with self._spi as spi:
+            while offset < length:
+                count = length - offset
+                # not min(), which allocates an argument tuple on CPython
+                if count > chunk:  # noqa: PLR1730
+                    count = chunk
+                stage[0] = _CAP1188_SPI_SET_ADDR
+                stage[1] = start + offset
+                for i in range(2, 3 + count):
+                    stage[i] = _CAP1188_SPI_READ_DATA
+                spi.write_readinto(stage, stage, out_end=3 + count, in_end=3 + count)
+                for i in range(count):
+                    buf[offset + i] = stage[3 + i]
+                offset += count
+
     def _write_block(self, start: int, data: Union[bytearray, bytes]) -> None:
         """Write out data beginning at start address."""
-        self._buf[0] = _CAP1188_SPI_SET_ADDR
-        self._buf[1] = start
+        # SET_ADDR, start, then a WRITE_DATA, value pair per byte in a single
+        # transfer; the address auto increments after each write
+        stage = self._stage
+        chunk = (len(stage) - 2) // 2
+        length = len(data)
+        offset = 0
         with self._spi as spi:
-            spi.write(self._buf, end=2)
-            self._buf[0] = _CAP1188_SPI_WRITE_DATA
-            for value in data:
-                self._buf[1] = value
-                spi.write(self._buf, end=2)
+            while offset < length:
+                count = length - offset
+                # not min(), which allocates an argument tuple on CPython
+                if count > chunk:  # noqa: PLR1730
+                    count = chunk
+                stage[0] = _CAP1188_SPI_SET_ADDR
+                stage[1] = start + offset
+                for i in range(count):
+                    stage[2 + 2 * i] = _CAP1188_SPI_WRITE_DATA
+                    stage[3 + 2 * i] = data[offset + i]
+                spi.write(stage, end=2 + 2 * count)
+                offset += count
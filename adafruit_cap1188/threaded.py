@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.threaded`
+====================================================
+
+Thread safe CAP1188 access for multi threaded Linux hosts using Blinka.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+`SharedCAP1188` wraps a driver so that every method call, property read and
+property write runs under one lock, which makes the read-modify-write
+sequences in `CAP1188.touched` and the configuration setters atomic. An
+optional background sampler publishes immutable snapshots that any number
+of threads can read through `SharedCAP1188.latest` without taking the lock::
+
+    shared = SharedCAP1188(CAP1188_I2C(board.I2C()))
+    shared.start()
+    # in any thread
+    frame = shared.latest
+    print(frame.status, frame.deltas)
+
+Requires the CPython ``threading`` module; not available on CircuitPython.
+
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+try:
+    from typing import Any, Optional
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+CAP1188_Frame = namedtuple(
+    "CAP1188_Frame", ("sequence", "timestamp", "status", "noise", "general_status", "deltas")
+)
+"""Immutable copy of a `CAP1188.snapshot`, with a sequence number and the
+`time.monotonic` timestamp of the read."""
+
+
+class _SharedChannel:
+    def __init__(self, shared: "SharedCAP1188", pin: int) -> None:
+        self._shared = shared
+        self._pin = pin
+
+    def __getattr__(self, name: str) -> Any:
+        shared = self._shared
+        with shared._lock:
+            value = getattr(shared._cap1188[self._pin], name)
+        if callable(value):
+            return shared._locked(value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            self.__dict__[name] = value
+            return
+        shared = self._shared
+        with shared._lock:
+            setattr(shared._cap1188[self._pin], name, value)
+
+
+class _SharedBatch:
+    """A driver batch holding the shared lock from entry to exit, so that
+    other threads wait instead of queueing into it."""
+
+    def __init__(self, shared: "SharedCAP1188") -> None:
+        self._shared = shared
+        self._batch = None
+
+    def __enter__(self) -> Any:
+        lock = self._shared._lock
+        lock.acquire()
+        try:
+            self._batch = self._shared._cap1188.batch()
+            return self._batch.__enter__()
+        except BaseException:
+            lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self._batch.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._shared._lock.release()
+
+
+class SharedCAP1188:
+    """A CAP1188 driver that can be used from several threads. Attributes of
+    the wrapped driver are available as usual, each access holding the lock.
+
+    :param CAP1188 cap1188: The driver to share.
+    """
+
+    def __init__(self, cap1188: "CAP1188") -> None:
+        self._cap1188 = cap1188
+        self._lock = threading.RLock()
+        self._latest = None
+        self._sequence = 0
+        self._thread = None
+        self._stop = threading.Event()
+        self._sampler_errors = 0
+        self._sampler_error = None
+
+    @property
+    def lock(self) -> threading.RLock:
+        """The lock serializing bus access. Hold it to group several calls
+        into one atomic sequence."""
+        return self._lock
+
+    @property
+    def latest(self) -> Optional[CAP1188_Frame]:
+        """The most recent frame published by `snapshot` or the sampler, read
+        without locking. `None` until the first frame."""
+        return self._latest
+
+    @property
+    def sampler_errors(self) -> int:
+        """Number of sampler reads that failed with a bus error."""
+        return self._sampler_errors
+
+    @property
+    def sampler_error(self) -> Optional[OSError]:
+        """The most recent bus error of the sampler, or `None`."""
+        return self._sampler_error
+
+    def _locked(self, method: Any) -> Any:
+        def call(*args, **kwargs):
+            with self._lock:
+                return method(*args, **kwargs)
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        with self._lock:
+            value = getattr(self._cap1188, name)
+        if callable(value):
+            return self._locked(value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            self.__dict__[name] = value
+            return
+        with self._lock:
+            setattr(self._cap1188, name, value)
+
+    def batch(self) -> _SharedBatch:
+        """Return a context manager like `CAP1188_Settings.batch` that holds
+        the lock for the whole block. Other threads accessing the driver wait
+        until the batch has been written."""
+        return _SharedBatch(self)
+
+    def __getitem__(self, pin: int) -> _SharedChannel:
+        self._cap1188[pin]  # validate pin
+        return _SharedChannel(self, pin)
+
+    def snapshot(self) -> CAP1188_Frame:
+        """Read a new snapshot, publish it as `latest` and return it."""
+        with self._lock:
+            snapshot = self._cap1188.snapshot()
+            sequence = self._sequence + 1
+            frame = CAP1188_Frame(
+                sequence,
+                time.monotonic(),
+                snapshot.status,
+                snapshot.noise,
+                snapshot.general_status,
+                tuple(snapshot.deltas),
+            )
+            self._sequence = sequence
+            self._latest = frame
+        return frame
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """Start a background thread publishing a snapshot every interval
+        seconds, by default the sensor cycle time. Bus errors do not stop the
+        sampler; they are counted in `sampler_errors`."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("Sampler is already running.")
+        if interval is None:
+            interval = self.cycle_seconds
+        self._stop.clear()
+        thread = threading.Thread(
+            target=self._sample, args=(interval,), name="cap1188-sampler", daemon=True
+        )
+        self._thread = thread
+        thread.start()
+
+    def stop(self) -> None:
+        """Stop the background sampler and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _sample(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.snapshot()
+            except OSError as error:
+                # keep sampling, the bus may recover
+                self._sampler_errors += 1
+                self._sampler_error = error
+            self._stop.wait(interval)
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_cap1188.tuning`
+====================================================
+
+Automatic touch threshold and sensitivity tuning from observed delta counts.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Sample while the pads are not being touched. The tuner keeps a running mean
+and variance per pin (Welford's algorithm, fixed memory) and sets each
+threshold to ``mean + k * stddev``. ``k`` comes from Cantelli's inequality,
+so the target false positive rate holds whatever the noise distribution is.
+If deltas saturate at the int8 limits, or a threshold would not fit the
+register, the tuner halves `CAP1188_Settings.sensitivity` and starts
+sampling again::
+
+    tuner = CAP1188_AutoTuner(cap)
+    while not tuner.run(100):
+        pass
+
+"""
+
+import math
+import time
+
+from micropython import const
+
+try:
+    from typing import Optional
+
+    from adafruit_cap1188.cap1188 import CAP1188
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CAP1188.git"
+
+_CAP1188_THESHOLD_1 = const(0x30)
+
+
+class CAP1188_AutoTuner:
+    """Tune the touch thresholds of all pins of a CAP1188 from noise samples.
+
+    :param CAP1188 cap1188: The sensor to tune.
+    :param float false_positive_rate: Target chance that a noise sample of an
+        untouched pin reaches its threshold.
+    :param float saturation_limit: Fraction of samples allowed to hit the int8
+        delta limits before sensitivity is reduced.
+    """
+
+    def __init__(
+        self,
+        cap1188: "CAP1188",
+        false_positive_rate: float = 0.001,
+        saturation_limit: float = 0.01,
+    ) -> None:
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1.")
+        self._cap1188 = cap1188
+        self._k = math.sqrt(1 / false_positive_rate - 1)
+        self._saturation_limit = saturation_limit
+        self._mean = [0.0] * 8
+        self._m2 = [0.0] * 8
+        self._thresholds = bytearray(8)
+        self.samples = 0
+        """Number of samples in the current statistics."""
+        self.saturated = 0
+        """Number of samples in which any pin hit the int8 delta limits."""
+
+    def reset(self) -> None:
+        """Discard the collected statistics."""
+        for i in range(8):
+            self._mean[i] = 0.0
+            self._m2[i] = 0.0
+        self.samples = 0
+        self.saturated = 0
+
+    def sample(self) -> None:
+        """Read the delta counts of all pins in one burst and add them to the
+        statistics."""
+        deltas = self._cap1188.snapshot().deltas
+        self.samples += 1
+        count = self.samples
+        saturated = False
+        for i in range(8):
+            value = deltas[i]
+            if value in {127, -128}:
+                saturated = True
+            difference = value - self._mean[i]
+            self._mean[i] += difference / count
+            self._m2[i] += difference * (value - self._mean[i])
+        if saturated:
+            self.saturated += 1
+
+    def mean(self, pin: int) -> float:
+        """Mean delta count of pin (1-8)."""
+        return self._mean[pin - 1]
+
+    def stddev(self, pin: int) -> float:
+        """Standard deviation of the delta count of pin (1-8)."""
+        if self.samples < 2:
+            return 0.0
+        return math.sqrt(self._m2[pin - 1] / (self.samples - 1))
+
+    def thresholds(self) -> bytearray:
+        """Return the tuned thresholds for pins 1 to 8, unclamped values above
+        127 are reported as 128."""
+        for i in range(8):
+            value = math.ceil(self.mean(i + 1) + self._k * self.stddev(i + 1))
+            self._thresholds[i] = max(1, min(128, value))
+        return self._thresholds
+
+    def apply(self) -> bool:
+        """Write the tuned thresholds to the sensor with a single block write
+        and return `True`. If the deltas saturated or a threshold does not
+        fit, halve the sensitivity, reset the statistics and return `False`
+        so that sampling can start over."""
+        if self.samples < 2:
+            raise RuntimeError("At least 2 samples are needed to tune.")
+        thresholds = self.thresholds()
+        if self.saturated > self.samples * self._saturation_limit or max(thresholds) > 127:
+            sensitivity = self._cap1188.sensitivity
+            if sensitivity == 1:
+                raise RuntimeError("Noise exceeds the range of the least sensitive setting.")
+            self._cap1188.sensitivity = sensitivity // 2
+            self.reset()
+            return False
+        self._cap1188._write_config_block(_CAP1188_THESHOLD_1, thresholds)
+        return True
+
+    def run(self, samples: int = 100, interval: Optional[float] = None) -> bool:
+        """Take samples, interval seconds apart, and `apply` the result.
+        interval defaults to the sensor cycle time, so that every sample is a
+        new measurement."""
+        if interval is None:
+            interval = self._cap1188.cycle_seconds
+        for _ in range(samples):
+            self.sample()
+            time.sleep(interval)
+        return self.apply()
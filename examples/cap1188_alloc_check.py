@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Host side check that the hot path register I/O does not allocate, run against
+# the simulator over both I2C and SPI. Memory blocks allocated by the driver
+# and bus device code are counted with tracemalloc while each bus transaction
+# is in flight and after each call returns; exits non-zero if a zero
+# allocation operation allocated. CPython allocates a bound __exit__ method
+# for every with statement, which MicroPython does not, so allocations on
+# with statement lines are not counted.
+#   python3 cap1188_alloc_check.py
+
+import linecache
+import sys
+import tracemalloc
+
+from adafruit_cap1188.i2c import CAP1188_I2C
+from adafruit_cap1188.simulator import (
+    CAP1188_Simulator,
+    SimulatedI2C,
+    SimulatedPin,
+    SimulatedSPI,
+)
+from adafruit_cap1188.spi import CAP1188_SPI
+
+REPEAT = 10
+
+FILTERS = (
+    tracemalloc.Filter(True, "*adafruit_cap1188*"),
+    tracemalloc.Filter(True, "*adafruit_bus_device*"),
+    tracemalloc.Filter(False, "*simulator.py"),
+)
+
+
+def driver_blocks():
+    count = 0
+    for trace in tracemalloc.take_snapshot().filter_traces(FILTERS).traces:
+        frame = trace.traceback[0]
+        if not linecache.getline(frame.filename, frame.lineno).lstrip().startswith("with "):
+            count += 1
+    return count
+
+
+class ProbeSimulator(CAP1188_Simulator):
+    """Simulator recording the driver's live allocations at every transaction."""
+
+    def __init__(self):
+        super().__init__()
+        self.blocks_before = None
+        self.in_flight = 0
+
+    def _fault(self):
+        if self.blocks_before is not None:
+            self.in_flight = max(self.in_flight, driver_blocks() - self.blocks_before)
+        super()._fault()
+
+
+TRANSPORTS = {
+    "i2c": lambda sim: CAP1188_I2C(SimulatedI2C(sim)),
+    "spi": lambda sim: CAP1188_SPI(SimulatedSPI(sim), SimulatedPin()),
+}
+
+DELTAS = bytearray(8)
+THRESHOLDS = bytearray(8)
+TOUCHED = [False] * 8
+RAW = [0] * 8
+
+# operation, whether it must not allocate
+OPERATIONS = {
+    "snapshot()": (lambda cap: cap.snapshot(), True),
+    "_read_block_into(0x10, buf)": (lambda cap: cap._read_block_into(0x10, DELTAS), True),
+    "threshold_values(buf)": (lambda cap: cap.threshold_values(THRESHOLDS), True),
+    "touched_pins_into(list)": (lambda cap: cap.touched_pins_into(TOUCHED), True),
+    "raw_values(list)": (lambda cap: cap.raw_values(RAW), True),
+    # allocating references, proving the probe sees allocations
+    "_read_block(0x10, 8)": (lambda cap: cap._read_block(0x10, 8), False),
+    "threshold_values()": (lambda cap: cap.threshold_values(), False),
+}
+
+
+def measure(sim, cap, operation):
+    operation(cap)  # warm up lazily created state
+    results = []
+    sim.in_flight = 0
+    sim.blocks_before = driver_blocks()
+    for _ in range(REPEAT):
+        results.append(operation(cap))
+    retained = driver_blocks() - sim.blocks_before
+    sim.blocks_before = None
+    return sim.in_flight, retained
+
+
+tracemalloc.start(1)
+failures = 0
+for transport, make in TRANSPORTS.items():
+    sim = ProbeSimulator()
+    cap = make(sim)
+    sim.touch(2)
+    for name, (operation, zero) in OPERATIONS.items():
+        in_flight, retained = measure(sim, cap, operation)
+        allocated = in_flight or retained
+        verdict = "ok"
+        if zero and allocated:
+            verdict = "FAIL"
+            failures += 1
+        elif not zero and not allocated:
+            verdict = "FAIL: probe saw no allocation"
+            failures += 1
+        print(f"{transport}:{name:30} {in_flight:3} in flight {retained:4} retained  {verdict}")
+tracemalloc.stop()
+sys.exit(1 if failures else 0)
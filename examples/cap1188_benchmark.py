@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Host side benchmark of bus cost per public API call, run against the simulator.
+#   python3 cap1188_benchmark.py --output baseline.json
+#   python3 cap1188_benchmark.py --baseline baseline.json
+
+import argparse
+import json
+import sys
+import time
+
+from adafruit_cap1188.i2c import CAP1188_I2C
+from adafruit_cap1188.simulator import (
+    CAP1188_Simulator,
+    SimulatedI2C,
+    SimulatedPin,
+    SimulatedSPI,
+)
+from adafruit_cap1188.spi import CAP1188_SPI
+
+REPEAT = 100
+
+TRANSPORTS = {
+    "i2c": lambda sim: CAP1188_I2C(SimulatedI2C(sim)),
+    "spi": lambda sim: CAP1188_SPI(SimulatedSPI(sim), SimulatedPin()),
+}
+
+
+def set_attribute(name, value):
+    return lambda cap: setattr(cap, name, value)
+
+
+def set_threshold(pin):
+    return lambda cap: setattr(cap[pin], "threshold", 50)
+
+
+OPERATIONS = {
+    "touched()": lambda cap: cap.touched(),
+    "touched_pins": lambda cap: cap.touched_pins,
+    "snapshot()": lambda cap: cap.snapshot(),
+    "threshold_values()": lambda cap: cap.threshold_values(),
+    "thresholds=": set_attribute("thresholds", 40),
+    "sensitivity": lambda cap: cap.sensitivity,
+    "sensitivity=": set_attribute("sensitivity", 32),
+    "averaging": lambda cap: cap.averaging,
+    "averaging=": set_attribute("averaging", 4),
+    "sample": lambda cap: cap.sample,
+    "sample=": set_attribute("sample", "640us"),
+    "cycle": lambda cap: cap.cycle,
+    "cycle=": set_attribute("cycle", "70ms"),
+    "recalibrate()": lambda cap: cap.recalibrate(),
+}
+for channel in range(1, 9):
+    OPERATIONS[f"cap[{channel}].value"] = lambda cap, pin=channel: cap[pin].value
+    OPERATIONS[f"cap[{channel}].raw_value"] = lambda cap, pin=channel: cap[pin].raw_value
+    OPERATIONS[f"cap[{channel}].threshold"] = lambda cap, pin=channel: cap[pin].threshold
+    OPERATIONS[f"cap[{channel}].threshold="] = set_threshold(channel)
+
+
+def measure(sim, operation):
+    sim.reset_counters()
+    start = time.perf_counter_ns()
+    for _ in range(REPEAT):
+        operation()
+    elapsed = time.perf_counter_ns() - start
+    return {
+        "transactions": sim.transactions / REPEAT,
+        "bytes": (sim.bytes_written + sim.bytes_read) / REPEAT,
+        "time_us": elapsed / REPEAT / 1000,
+    }
+
+
+def run():
+    results = {}
+    for transport, make in TRANSPORTS.items():
+        sim = CAP1188_Simulator()
+        results[f"{transport}:CAP1188()"] = measure(sim, lambda make=make, sim=sim: make(sim))
+        cap = make(sim)
+        sim.touch(2)
+        for name, operation in OPERATIONS.items():
+            results[f"{transport}:{name}"] = measure(sim, lambda op=operation: op(cap))
+    return results
+
+
+def compare(results, baseline):
+    regressions = 0
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for key in ("transactions", "bytes"):
+            if result[key] > baseline[name][key]:
+                regressions += 1
+                print(f"REGRESSION {name} {key}: {baseline[name][key]:g} -> {result[key]:g}")
+    return regressions
+
+
+parser = argparse.ArgumentParser(description="CAP1188 bus cost benchmark")
+parser.add_argument("--output", help="write results as JSON to this file")
+parser.add_argument("--baseline", help="compare against results stored in this JSON file")
+args = parser.parse_args()
+
+benchmark = run()
+for op_name, op_result in benchmark.items():
+    print(
+        f"{op_name:32} {op_result['transactions']:6g} txn "
+        f"{op_result['bytes']:6g} bytes {op_result['time_us']:9.1f} us"
+    )
+if args.output:
+    with open(args.output, "w") as file:
+        json.dump(benchmark, file, indent=2, sort_keys=True)
+if args.baseline:
+    with open(args.baseline) as file:
+        if compare(benchmark, json.load(file)):
+            sys.exit(1)
+    print("No regressions against baseline.")
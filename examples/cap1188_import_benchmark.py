@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Host side check that the core driver import stays small. Each import is
+# measured in a fresh CPython interpreter, after the third party and standard
+# library modules the driver depends on, so the counts cover only the driver.
+# Exits non-zero if a core import loads an optional feature module, or loads
+# more modules or creates more objects than the stored limits. Raise a limit
+# deliberately, in the same change that needs it.
+#   python3 cap1188_import_benchmark.py
+
+import json
+import subprocess
+import sys
+
+OPTIONAL = (
+    "adafruit_cap1188.asyncio",
+    "adafruit_cap1188.batch",
+    "adafruit_cap1188.calibration",
+    "adafruit_cap1188.config",
+    "adafruit_cap1188.events",
+    "adafruit_cap1188.gestures",
+    "adafruit_cap1188.health",
+    "adafruit_cap1188.i2c_array",
+    "adafruit_cap1188.instrument",
+    "adafruit_cap1188.recorder",
+    "adafruit_cap1188.retry",
+    "adafruit_cap1188.service",
+    "adafruit_cap1188.simulator",
+    "adafruit_cap1188.slider",
+    "adafruit_cap1188.threaded",
+    "adafruit_cap1188.tuning",
+)
+
+# core import: (most modules loaded, most objects created)
+LIMITS = {
+    "adafruit_cap1188": (1, 10),
+    "adafruit_cap1188.core": (2, 125),
+    "adafruit_cap1188.cap1188": (4, 225),
+    "adafruit_cap1188.i2c": (5, 250),
+    "adafruit_cap1188.spi": (5, 250),
+}
+CORE = tuple(LIMITS)
+
+DEPENDENCIES = (
+    "typing",
+    "micropython",
+    "digitalio",
+    "adafruit_bus_device.i2c_device",
+    "adafruit_bus_device.spi_device",
+)
+
+PROBE = """
+import gc, json, sys, time, tracemalloc
+for dependency in sys.argv[2:]:
+    __import__(dependency)
+before = set(sys.modules)
+gc.collect()
+objects = len(gc.get_objects())
+tracemalloc.start()
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = time.perf_counter() - start
+memory = tracemalloc.get_traced_memory()[0]
+gc.collect()
+loaded = sorted(set(sys.modules) - before)
+print(json.dumps({
+    "time_ms": elapsed * 1000,
+    "memory_bytes": memory,
+    "modules": len(loaded),
+    "objects": len(gc.get_objects()) - objects,
+    "loaded": loaded,
+}))
+"""
+
+
+def probe(module):
+    output = subprocess.check_output([sys.executable, "-c", PROBE, module, *DEPENDENCIES])
+    return json.loads(output)
+
+
+failures = 0
+for name in CORE + OPTIONAL:
+    result = probe(name)
+    print(
+        f"{name:30} {result['time_ms']:7.2f} ms {result['memory_bytes']:8} bytes "
+        f"{result['modules']:4} modules {result['objects']:7} objects"
+    )
+    if name in CORE:
+        for module in result["loaded"]:
+            if module in OPTIONAL:
+                print(f"  FAIL: importing {name} loaded {module}")
+                failures += 1
+        max_modules, max_objects = LIMITS[name]
+        if result["modules"] > max_modules:
+            print(f"  FAIL: {result['modules']} modules, limit {max_modules}: {result['loaded']}")
+            failures += 1
+        if result["objects"] > max_objects:
+            print(f"  FAIL: {result['objects']} objects, limit {max_objects}")
+            failures += 1
+sys.exit(1 if failures else 0)